@@ -1,12 +1,24 @@
 import math
-from typing import Dict, List
+import threading
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Optional
+
+import matplotlib
+
+# Headless server: select Agg before pyplot is imported so it never probes
+# for GUI backends, and keep interactive mode off.
+matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 from matplotlib.ticker import FormatStrFormatter
 
-from .types import Measurement
+from .types import BLADE_IDX, BLADES, Measurement, measurement_from_key, measurement_key, regimes_from_key, regimes_key
 
-BLADES = ["BLU", "GRN", "YEL", "RED"]
+plt.ioff()
 
 # Keep in sync with vxp.sim.REGIMES
 REGIMES = ["GROUND", "HOVER", "HORIZ"]
@@ -33,33 +45,74 @@ BLADE_COLOR = {
     "RED": "#B00020",
 }
 
+# Blade colors in BLADES order (scatter colors / trend line cycle).
+_BLADE_COLORS = tuple(BLADE_COLOR[b] for b in BLADES)
+
 REGIME_TAG = {"GROUND": "GND", "HOVER": "HOV", "HORIZ": "HOR"}
 REGIME_COLOR = {"GROUND": "#000000", "HOVER": "#0047AB", "HORIZ": "#0A8F08"}
 
+# Polar plots are labelled like a clock face (12 at the top, clockwise).
+_POLAR_TICKS = tuple(math.radians(t) for t in range(0, 360, 30))
+_POLAR_LABELS = ("12", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11")
+
+
+@lru_cache(maxsize=64)
+def _rticks(rmax: float) -> tuple:
+    """Radial ticks every 0.1 like the legacy screen (rmax is a 0.05 ring)."""
+    rticks = [round(0.1 * i, 2) for i in range(1, int(rmax / 0.1) + 1)]
+    if rticks and rticks[-1] < rmax:
+        rticks.append(rmax)
+    if not rticks:
+        rticks = [0.1, 0.2, 0.3]
+    return tuple(rticks)
+
+
+def _track_matrix(meas_by_regime: Dict[str, Measurement], regimes: List[str], blade_ref: str) -> np.ndarray:
+    """Return a (regimes, blades) array of track values relative to blade_ref."""
+    tracks = np.array(
+        [meas_by_regime[r].track_mm for r in regimes],
+        dtype=float,
+    ).reshape(-1, len(BLADES))
+    tracks -= tracks[:, [BLADE_IDX[blade_ref]]]
+    return tracks
 
-def _track_rel(meas: Measurement, blade_ref: str) -> List[float]:
-    """Return track values relative to blade_ref."""
-    ref = float(meas.track_mm.get(blade_ref, 0.0))
-    return [float(meas.track_mm[b]) - ref for b in BLADES]
+
+def _no_data(fig: plt.Figure) -> plt.Figure:
+    """Placeholder used before any regime is collected (skips all axes setup)."""
+    # Invisible frame so the tight-bbox crop keeps the full figure size.
+    fig.add_artist(Rectangle((0.0, 0.0), 1.0, 1.0, transform=fig.transFigure, fill=False, linewidth=0))
+    fig.text(0.5, 0.5, "No data", ha="center", va="center", fontsize=9, fontweight="bold")
+    return fig
 
 
 def plot_measurements_panel(
     meas_by_regime: Dict[str, Measurement],
     selected_regime: str,
     blade_ref: str = "YEL",
+    fig: Optional[plt.Figure] = None,
 ) -> plt.Figure:
     """Single, VXP-like right panel: track marker + track trend + polar.
 
     Goal: look closer to the legacy VXP layout and waste as little space as
     possible inside a 1024×768 frame.
+
+    If ``fig`` is given it is cleared and redrawn instead of allocating a new
+    figure.
     """
 
     # Right pane is around half width of XGA; build a single figure to avoid
     # Streamlit margins between multiple plots.
     # Keep the panel compact so the two legacy-style buttons fit below the plots
     # within a 1024×768 window.
-    fig = plt.figure(figsize=(4.8, 5.05), dpi=120)
+    # The PNG is shown at ~400 px wide, so 96 dpi (~500 px) still never gets
+    # upscaled and gives Agg a third fewer pixels to fill than 120 dpi.
+    if fig is None:
+        fig = plt.figure(figsize=(4.8, 5.05), dpi=96)
+    else:
+        fig.clear()
     fig.patch.set_facecolor("#c0c0c0")
+    if not meas_by_regime:
+        return _no_data(fig)
 
     gs = fig.add_gridspec(nrows=3, ncols=1, height_ratios=[1.0, 1.15, 3.0], hspace=0.28)
 
@@ -67,6 +120,9 @@ def plot_measurements_panel(
     if selected_regime not in meas_by_regime and regimes_present:
         selected_regime = regimes_present[0]
 
+    # Relative track values for every regime, shared by the marker and trend plots.
+    tracks = _track_matrix(meas_by_regime, regimes_present, blade_ref)
+
     # ----------------------
     # Track marker (selected regime)
     # ----------------------
@@ -88,16 +144,15 @@ def plot_measurements_panel(
     for i in range(1, len(BLADES) + 1):
         ax1.axvline(i, color="black", linewidth=0.6, linestyle=":")
 
-    m = meas_by_regime[selected_regime]
     xs = list(range(1, len(BLADES) + 1))
-    ys = _track_rel(m, blade_ref)
+    ys = tracks[regimes_present.index(selected_regime)]
 
     ax1.scatter(
         xs,
         ys,
         marker="s",
         s=30,
-        c=[BLADE_COLOR[b] for b in BLADES],
+        c=_BLADE_COLORS,
         edgecolors="black",
         linewidths=0.4,
         zorder=5,
@@ -129,29 +184,21 @@ def plot_measurements_panel(
     for xi in x:
         ax2.axvline(xi, color="black", linewidth=0.6, linestyle=":")
 
-    for b in BLADES:
-        yb = []
-        for r in regimes_present:
-            rr = _track_rel(meas_by_regime[r], blade_ref)
-            yb.append(rr[BLADES.index(b)])
-        ax2.plot(
-            x,
-            yb,
-            marker="o",
-            markersize=3.5,
-            linewidth=1.2,
-            color=BLADE_COLOR[b],
-        )
+    # One row per regime, one column per blade; a single plot call draws
+    # every blade (matplotlib plots 2D y column-wise), colored by the cycle.
+    ax2.set_prop_cycle(color=_BLADE_COLORS)
+    ax2.plot(x, tracks, marker="o", markersize=3.5, linewidth=1.2)
 
+    for i, b in enumerate(BLADES):
         # Inline blade label near the last point (no legend box)
         if len(x) > 0:
             ax2.text(
                 x[-1] + 0.08,
-                yb[-1],
+                tracks[-1, i],
                 b,
                 fontsize=8,
                 fontweight="bold",
-                color=BLADE_COLOR[b],
+                color=_BLADE_COLORS[i],
                 va="center",
             )
 
@@ -173,22 +220,15 @@ def plot_measurements_panel(
     ax3.set_theta_zero_location("N")
     ax3.set_theta_direction(-1)
 
-    ticks = [math.radians(t) for t in range(0, 360, 30)]
-    labels = ["12", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"]
-    ax3.set_xticks(ticks)
-    ax3.set_xticklabels(labels, fontsize=9, fontweight="bold")
+    ax3.set_xticks(_POLAR_TICKS)
+    ax3.set_xticklabels(_POLAR_LABELS, fontsize=9, fontweight="bold")
 
     amps = [meas_by_regime[r].balance.amp_ips for r in regimes_present]
     rmax = max([0.35] + [a * 1.8 for a in amps])
     rmax = math.ceil(rmax * 20.0) / 20.0  # nice ring (0.05)
     ax3.set_rmax(rmax)
 
-    # Radial ticks every 0.1 like the legacy screen
-    rticks = [round(0.1 * i, 2) for i in range(1, int(rmax / 0.1) + 1)]
-    if rticks and rticks[-1] < rmax:
-        rticks.append(rmax)
-    if not rticks:
-        rticks = [0.1, 0.2, 0.3]
+    rticks = _rticks(rmax)
 
     ax3.set_rticks(rticks)
     ax3.set_yticklabels([f"{t:.2f}" if t < 1 else f"{t:.1f}" for t in rticks], fontsize=8)
@@ -196,9 +236,9 @@ def plot_measurements_panel(
 
     # Plot each regime as a colored point and annotate close to the point.
     for r in regimes_present:
-        meas = meas_by_regime[r]
-        theta = math.radians(meas.balance.phase_deg)
-        amp = meas.balance.amp_ips
+        bal = meas_by_regime[r].balance
+        theta = math.radians(bal.phase_deg)
+        amp = bal.amp_ips
         ax3.plot(
             [theta],
             [amp],
@@ -232,7 +272,7 @@ def plot_track_marker(meas: Measurement) -> plt.Figure:
     for i in range(1, len(BLADES) + 1):
         ax.axvline(i, color="black", linewidth=0.6, linestyle=":")
     xs = list(range(1, len(BLADES) + 1))
-    ys = [meas.track_mm[b] for b in BLADES]
+    ys = meas.track_mm
     ax.scatter(xs, ys, marker="s", s=28)
     ax.axhline(0.0, color="black", linewidth=0.8)
     ax.set_title(f"Track Height — {REGIME_LABEL_SHORT.get(meas.regime, meas.regime)}", fontsize=9, fontweight="bold")
@@ -247,10 +287,12 @@ def plot_track_graph(meas_by_regime: Dict[str, Measurement]) -> plt.Figure:
     xs = [REGIME_LABEL_SHORT[r] for r in REGIMES if r in meas_by_regime]
     fig = plt.figure(figsize=(3.6, 1.18), dpi=120)
     fig.patch.set_facecolor("#c0c0c0")
+    if not xs:
+        return _no_data(fig)
     ax = fig.add_subplot(111)
     ax.set_facecolor("white")
-    for b in BLADES:
-        ys = [meas_by_regime[r].track_mm[b] for r in REGIMES if r in meas_by_regime]
+    for i, b in enumerate(BLADES):
+        ys = [meas_by_regime[r].track_mm[i] for r in REGIMES if r in meas_by_regime]
         ax.plot(xs, ys, marker="s", linewidth=1.2, markersize=4, label=b)
     ax.set_ylim(-32.5, 32.5)
     ax.set_title("Track Height (rel. YEL)", fontsize=9, fontweight="bold")
@@ -271,24 +313,19 @@ def plot_polar(meas: Measurement) -> plt.Figure:
     ax.set_facecolor("white")
     ax.set_theta_zero_location("N")
     ax.set_theta_direction(-1)
-    ticks = [math.radians(t) for t in range(0, 360, 30)]
-    labels = ["12", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"]
-    ax.set_xticks(ticks)
-    ax.set_xticklabels(labels, fontsize=9, fontweight="bold")
-    rmax = max(0.35, meas.balance.amp_ips * 1.8)
+    ax.set_xticks(_POLAR_TICKS)
+    ax.set_xticklabels(_POLAR_LABELS, fontsize=9, fontweight="bold")
+    bal = meas.balance
+    rmax = max(0.35, bal.amp_ips * 1.8)
     rmax = math.ceil(rmax * 20.0) / 20.0
     ax.set_rmax(rmax)
-    rticks = [round(0.1 * i, 2) for i in range(1, int(rmax / 0.1) + 1)]
-    if rticks and rticks[-1] < rmax:
-        rticks.append(rmax)
-    if not rticks:
-        rticks = [0.1, 0.2, 0.3]
+    rticks = _rticks(rmax)
     ax.set_rticks(rticks)
     ax.set_yticklabels([f"{t:.2f}" for t in rticks], fontsize=8)
     ax.grid(True, linestyle=":", linewidth=0.6)
 
-    theta = math.radians(meas.balance.phase_deg)
-    ax.plot([theta], [meas.balance.amp_ips], marker="o", markersize=7, color="#000000")
+    theta = math.radians(bal.phase_deg)
+    ax.plot([theta], [bal.amp_ips], marker="o", markersize=7, color="#000000")
     fig.tight_layout(pad=0.55)
     return fig
 
@@ -296,14 +333,14 @@ def plot_polar(meas: Measurement) -> plt.Figure:
 def plot_polar_compare(meas_by_regime: Dict[str, Measurement]) -> plt.Figure:
     fig = plt.figure(figsize=(3.6, 2.35), dpi=120)
     fig.patch.set_facecolor("#c0c0c0")
+    if not meas_by_regime:
+        return _no_data(fig)
     ax = fig.add_subplot(111, projection="polar")
     ax.set_facecolor("white")
     ax.set_theta_zero_location("N")
     ax.set_theta_direction(-1)
-    ticks = [math.radians(t) for t in range(0, 360, 30)]
-    labels = ["12", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"]
-    ax.set_xticks(ticks)
-    ax.set_xticklabels(labels, fontsize=9, fontweight="bold")
+    ax.set_xticks(_POLAR_TICKS)
+    ax.set_xticklabels(_POLAR_LABELS, fontsize=9, fontweight="bold")
 
     regimes_present = [r for r in REGIMES if r in meas_by_regime]
     amps = [meas_by_regime[r].balance.amp_ips for r in regimes_present]
@@ -311,22 +348,93 @@ def plot_polar_compare(meas_by_regime: Dict[str, Measurement]) -> plt.Figure:
     rmax = math.ceil(rmax * 20.0) / 20.0
     ax.set_rmax(rmax)
 
-    rticks = [round(0.1 * i, 2) for i in range(1, int(rmax / 0.1) + 1)]
-    if rticks and rticks[-1] < rmax:
-        rticks.append(rmax)
-    if not rticks:
-        rticks = [0.1, 0.2, 0.3]
+    rticks = _rticks(rmax)
     ax.set_rticks(rticks)
     ax.set_yticklabels([f"{t:.2f}" for t in rticks], fontsize=8)
     ax.grid(True, linestyle=":", linewidth=0.6)
 
     for r in regimes_present:
-        meas = meas_by_regime[r]
-        theta = math.radians(meas.balance.phase_deg)
-        amp = meas.balance.amp_ips
+        bal = meas_by_regime[r].balance
+        theta = math.radians(bal.phase_deg)
+        amp = bal.amp_ips
         ax.plot([theta], [amp], marker="o", markersize=7, color=REGIME_COLOR.get(r, "black"))
         tag = REGIME_TAG.get(r, r[:3].upper())
         ax.text(theta, min(amp + 0.03, rmax * 0.98), f"{tag} {amp:.2f}", fontsize=8, ha="center")
 
     fig.tight_layout(pad=0.55)
     return fig
+
+
+# ------------------------------------------------------------------
+# Cached PNG rendering (used by the UI)
+# ------------------------------------------------------------------
+# Streamlit reruns the whole script on every interaction, usually with the
+# same measurements. Rendering each plot once to PNG bytes, keyed by a
+# hashable snapshot of its inputs, skips both figure construction and Agg
+# rasterization on those reruns.
+
+def _fig_to_png(fig: plt.Figure, close: bool = True) -> bytes:
+    buf = BytesIO()
+    # Same crop st.pyplot applies; the panel layout relies on it for tick labels.
+    fig.savefig(buf, format="png", dpi="figure", bbox_inches="tight")
+    if close:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+# The measurements panel is redrawn into one long-lived figure instead of
+# building a new Figure (and its artist tree) on every cache miss. Streamlit
+# runs each session in its own thread, so drawing is serialized by a lock.
+_PANEL_FIG = Figure(figsize=(4.8, 5.05), dpi=96)
+_PANEL_LOCK = threading.Lock()
+
+
+def measurements_panel_png(
+    meas_by_regime: Dict[str, Measurement],
+    selected_regime: str,
+    blade_ref: str = "YEL",
+) -> bytes:
+    return _measurements_panel_png(regimes_key(meas_by_regime), selected_regime, blade_ref)
+
+
+@lru_cache(maxsize=32)
+def _measurements_panel_png(key: tuple, selected_regime: str, blade_ref: str) -> bytes:
+    with _PANEL_LOCK:
+        plot_measurements_panel(regimes_from_key(key), selected_regime, blade_ref, fig=_PANEL_FIG)
+        return _fig_to_png(_PANEL_FIG, close=False)
+
+
+def track_marker_png(meas: Measurement) -> bytes:
+    return _track_marker_png(measurement_key(meas))
+
+
+@lru_cache(maxsize=32)
+def _track_marker_png(key: tuple) -> bytes:
+    return _fig_to_png(plot_track_marker(measurement_from_key(key)))
+
+
+def track_graph_png(meas_by_regime: Dict[str, Measurement]) -> bytes:
+    return _track_graph_png(regimes_key(meas_by_regime))
+
+
+@lru_cache(maxsize=32)
+def _track_graph_png(key: tuple) -> bytes:
+    return _fig_to_png(plot_track_graph(regimes_from_key(key)))
+
+
+def polar_png(meas: Measurement) -> bytes:
+    return _polar_png(measurement_key(meas))
+
+
+@lru_cache(maxsize=32)
+def _polar_png(key: tuple) -> bytes:
+    return _fig_to_png(plot_polar(measurement_from_key(key)))
+
+
+def polar_compare_png(meas_by_regime: Dict[str, Measurement]) -> bytes:
+    return _polar_compare_png(regimes_key(meas_by_regime))
+
+
+@lru_cache(maxsize=32)
+def _polar_compare_png(key: tuple) -> bytes:
+    return _fig_to_png(plot_polar_compare(regimes_from_key(key)))
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+import re
 
-from .types import Measurement
-from .solver import suggest_pitchlink, suggest_trimtabs, suggest_weight
+import numpy as np
 
-BLADES = ["BLU", "GRN", "YEL", "RED"]
+from .types import BLADE_IDX, BLADES, Measurement, MeasurementSet
+from .solver import suggest_pitchlink, suggest_trimtabs, suggest_weight
 
 # Blade colors (approximate legacy VXP palette)
 BLADE_COLOR = {
@@ -24,8 +25,13 @@ REGIME_COLOR = {
 
 
 def _c(txt: str, color: str) -> str:
-    """Wrap text in a color span. Safe for use inside vxp-mono (white-space:pre)."""
+    """Wrap text in a color span. Safe for use inside vxp-mono (white-space:pre).
+
+    Black is the default text color, so it is returned unwrapped.
+    """
 
+    if color in ("#000", "#000000"):
+        return txt
     return f"<span style='color:{color};'>{txt}</span>"
 
 
@@ -36,6 +42,75 @@ DISPLAY_POINTS: List[Tuple[str, str]] = [
     ("Horizontal Flight", "HORIZ"),
 ]
 
+# Colour-wrapped fixed labels, built once: the report is regenerated on
+# every Streamlit rerun.
+_REGIME_PREFIX = {(name, src): _c(f"{name:<18}", REGIME_COLOR.get(src, "#000")) for name, src in DISPLAY_POINTS}
+
+
+def _regime_prefix(name: str, src: str) -> str:
+    prefix = _REGIME_PREFIX.get((name, src))
+    return prefix if prefix is not None else _c(f"{name:<18}", REGIME_COLOR.get(src, "#000"))
+
+
+# Adjustments columns: fixed width so values appear directly under each blade.
+_ADJ_COL_W = 8
+_ADJ_BLADES_HDR = "".join(_c(f"{b:>{_ADJ_COL_W}}", BLADE_COLOR[b]) for b in BLADES)
+
+# Per-blade row templates, filled positionally from a float64[4] (BLADES order).
+_TRACK_ROW = "  ".join(_c(f"{b}:{{{i}:+5.1f}}", BLADE_COLOR[b]) for i, b in enumerate(BLADES))
+
+
+def _adj_row_template(spec: str) -> str:
+    cells = "".join(_c(f"{{{i}:>{_ADJ_COL_W}{spec}}}", BLADE_COLOR[b]) for i, b in enumerate(BLADES))
+    return f"{'':<12}" + cells
+
+
+_ADJ_ROW = {spec: _adj_row_template(spec) for spec in (".2f", ".1f", ".0f")}
+
+
+def _weight_row(blade: str, grams: float) -> np.ndarray:
+    """Weight only goes on one blade: zeros except `blade`."""
+    row = np.zeros(len(BLADES))
+    row[BLADE_IDX[blade]] = float(grams)
+    return row
+
+# Static report lines (extended in one go instead of one append per line).
+_HDR = ("BO105   MAIN ROTOR   TRACK & BALANCE", "OPTION: B   STROBEX MODE: B")
+_USED_HDR = ("USED: Pitch link, Trim tab, Weight", "", "Adjustments")
+_ADJ_HDR = {
+    label: f"{label:<12}{_ADJ_BLADES_HDR}" for label in ("P/L(flats)", "TabS5(deg)", "TabS6(deg)", "Wt(plqts)")
+}
+
+
+# HTML Adjustments table (legacy_results_html): fixed markup built once, the
+# value rows are positional templates in BLADES order.
+_HTML_LABEL_TD = "<td style='width:140px; padding:2px 8px; text-align:left; white-space:pre; font-weight:700'>"
+
+
+def _html_td(text: str, color: str, bold: bool = False) -> str:
+    style = f"width:86px;padding:2px 8px;text-align:right;white-space:pre;color:{color}"
+    if bold:
+        style += ";font-weight:700"
+    return f"<td style='{style}'>{text}</td>"
+
+
+_HTML_ADJ_HEAD = (
+    "<div style='margin-top:6px; margin-bottom:6px; font-weight:700;'>Adjustments</div>"
+    "<table style='border-collapse:collapse; font-family:Courier New,Consolas,monospace; font-size:14px;'>"
+    "<tr>"
+    + _HTML_LABEL_TD
+    + "</td>"
+    + "".join(_html_td(b, BLADE_COLOR[b], bold=True) for b in BLADES)
+    + "</tr>"
+)
+_HTML_ADJ_ROW = {
+    label: "<tr>"
+    + f"{_HTML_LABEL_TD}{label}</td>"
+    + "".join(_html_td(f"{{{i}:{spec}}}", BLADE_COLOR[b]) for i, b in enumerate(BLADES))
+    + "</tr>"
+    for label, spec in (("P/L(flats)", "6.2f"), ("TabS5(deg)", "6.1f"), ("TabS6(deg)", "6.1f"), ("Wt(plqts)", "6.0f"))
+}
+
 
 def clock_label(theta_deg: float) -> str:
     """Convert phase degrees to a 12-hour clock label (legacy VXP style)."""
@@ -46,32 +121,46 @@ def clock_label(theta_deg: float) -> str:
     return f"{hour:02d}:{minute:02d}"
 
 
-def legacy_results_text(run: int, meas_by_regime: Dict[str, Measurement]) -> str:
+def clock_labels(thetas: np.ndarray) -> List[str]:
+    """Vectorized clock_label for a whole column of phases (same rounding)."""
+
+    h = np.asarray(thetas, dtype=float) / 30.0
+    nearest = np.round(h)
+    hours = np.mod(nearest.astype(int), 12)
+    hours = np.where(hours == 0, 12, hours)
+    minutes = np.where(np.abs(h - nearest) < 0.25, 0, 30)
+    return [f"{hh:02d}:{mm:02d}" for hh, mm in zip(hours.tolist(), minutes.tolist())]
+
+
+def legacy_results_text(
+    run: int,
+    meas_by_regime: Dict[str, Measurement],
+    display_points: Sequence[Tuple[str, str]] = DISPLAY_POINTS,
+) -> str:
     """Legacy-like mono report used on MEASUREMENTS GRAPH / LIST.
 
-    - BO105 only (Ground / Hover / Horizontal)
+    - BO105 only by default (Ground / Hover / Horizontal); `display_points`
+      selects other (label, regime) rows
     - Adds blade & regime color cues
     - Aligns Adjustments so values appear directly under each blade
     """
 
-    lines: List[str] = []
-    lines.append("BO105   MAIN ROTOR   TRACK & BALANCE")
-    lines.append("OPTION: B   STROBEX MODE: B")
-    lines.append(f"RUN: {run}   ID: TRAINING")
-    lines.append("")
+    # Regimes actually collected, in display order (filtered once):
+    # (display name, colored regime label, measurement)
+    active = [
+        (name, _regime_prefix(name, src), meas_by_regime[src]) for name, src in display_points if src in meas_by_regime
+    ]
+
+    lines: List[str] = [*_HDR, f"RUN: {run}   ID: TRAINING", ""]
 
     # -------------------------
     # Balance measurements
     # -------------------------
     lines.append("----- Balance Measurements -----")
-    for name, src in DISPLAY_POINTS:
-        if src not in meas_by_regime:
-            continue
-        m = meas_by_regime[src]
-        amp = float(m.balance.amp_ips)
-        ph = float(m.balance.phase_deg)
-        reg = _c(f"{name:<18}", REGIME_COLOR.get(src, "#000"))
-        lines.append(f"{reg}  1P {amp:0.2f} IPS  {clock_label(ph):>5}  RPM:{m.balance.rpm:0.0f}")
+    clocks = clock_labels(np.fromiter((m.balance.phase_deg for _n, _r, m in active), dtype=float, count=len(active)))
+    for (_name, reg, m), clock in zip(active, clocks):
+        bal = m.balance
+        lines.append(f"{reg}  1P {float(bal.amp_ips):0.2f} IPS  {clock:>5}  RPM:{bal.rpm:0.0f}")
 
     lines.append("")
 
@@ -79,13 +168,8 @@ def legacy_results_text(run: int, meas_by_regime: Dict[str, Measurement]) -> str
     # Track height
     # -------------------------
     lines.append("----- Track Height (mm rel. YEL) -----")
-    for name, src in DISPLAY_POINTS:
-        if src not in meas_by_regime:
-            continue
-        m = meas_by_regime[src]
-        reg = _c(f"{name:<18}", REGIME_COLOR.get(src, "#000"))
-        parts = [_c(f"{b}:{m.track_mm[b]:+5.1f}", BLADE_COLOR[b]) for b in BLADES]
-        lines.append(f"{reg}  " + "  ".join(parts))
+    for _name, reg, m in active:
+        lines.append(f"{reg}  " + _TRACK_ROW.format(*m.track_mm.tolist()))
 
     # -------------------------
     # Solution / Prediction
@@ -93,7 +177,7 @@ def legacy_results_text(run: int, meas_by_regime: Dict[str, Measurement]) -> str
     lines.append("")
     lines.append("----- Solution Options -----")
 
-    used_regimes = [name for name, src in DISPLAY_POINTS if src in meas_by_regime]
+    used_regimes = [name for name, _reg, _m in active]
     if not used_regimes:
         lines.append("(No regimes collected yet)")
         lines.append("")
@@ -101,77 +185,65 @@ def legacy_results_text(run: int, meas_by_regime: Dict[str, Measurement]) -> str
 
     lines.append("SOLUTION TYPE: BALANCE")
     lines.append(f"REGIMES USED: {', '.join(used_regimes)}")
-    lines.append("USED: Pitch link, Trim tab, Weight")
+    lines.extend(_USED_HDR)
 
-    pl = suggest_pitchlink(meas_by_regime)
-    tt = suggest_trimtabs(meas_by_regime)
-    wb, wg = suggest_weight(meas_by_regime)
-
-    lines.append("")
-    lines.append("Adjustments")
+    ms = MeasurementSet.from_dict(meas_by_regime)
+    pl = suggest_pitchlink(ms)
+    tt = suggest_trimtabs(ms)
+    wb, wg = suggest_weight(ms)
 
     # Header aligned like the original (values appear directly under each blade).
     # We use fixed-width columns so the result is stable even with inline <span> coloring.
-    COL_W = 8
-
-    def _hblade(b: str) -> str:
-        return _c(f"{b:>{COL_W}}", BLADE_COLOR[b])
-
-    def _vblade(b: str, s: str) -> str:
-        return _c(f"{s:>{COL_W}}", BLADE_COLOR[b])
-
-    def _hdr(label: str) -> str:
-        return f"{label:<12}" + _hblade("BLU") + _hblade("GRN") + _hblade("YEL") + _hblade("RED")
-
-    def _row(label: str, vals: Dict[str, float], fmt: str) -> str:
-        return (
-            f"{label:<12}"
-            + _vblade("BLU", format(vals["BLU"], fmt))
-            + _vblade("GRN", format(vals["GRN"], fmt))
-            + _vblade("YEL", format(vals["YEL"], fmt))
-            + _vblade("RED", format(vals["RED"], fmt))
-        )
-
     # P/L
-    lines.append(_hdr("P/L(flats)"))
-    lines.append(_row("", pl, "6.2f"))
+    lines.append(_ADJ_HDR["P/L(flats)"])
+    lines.append(_ADJ_ROW[".2f"].format(*pl.tolist()))
 
     # Keep the same names as the legacy screen (TabS5/TabS6)
-    lines.append(_hdr("TabS5(deg)"))
-    lines.append(_row("", {b: tt[b] * 0.8 for b in BLADES}, "6.1f"))
-    lines.append(_hdr("TabS6(deg)"))
-    lines.append(_row("", {b: tt[b] * 0.8 for b in BLADES}, "6.1f"))
+    tabs = (tt * 0.8).tolist()
+    lines.append(_ADJ_HDR["TabS5(deg)"])
+    lines.append(_ADJ_ROW[".1f"].format(*tabs))
+    lines.append(_ADJ_HDR["TabS6(deg)"])
+    lines.append(_ADJ_ROW[".1f"].format(*tabs))
 
     # Weight (only one blade gets the suggested grams)
-    wrow = {b: 0.0 for b in BLADES}
-    wrow[wb] = float(wg)
-    lines.append(_hdr("Wt(plqts)"))
-    lines.append(_row("", wrow, "6.0f"))
+    lines.append(_ADJ_HDR["Wt(plqts)"])
+    lines.append(_ADJ_ROW[".0f"].format(*_weight_row(wb, wg).tolist()))
 
     lines.append("")
     lines.append("----- Prediction -----")
-    for name, src in DISPLAY_POINTS:
-        if src not in meas_by_regime:
-            continue
-        m = meas_by_regime[src]
-        reg = _c(f"{name:<18}", REGIME_COLOR.get(src, "#000"))
+    for _name, reg, m in active:
         lines.append(f"{reg}  M/R L   {m.balance.amp_ips:0.2f}")
 
     lines.append("Track Split")
-    for name, src in DISPLAY_POINTS:
-        if src not in meas_by_regime:
-            continue
-        m = meas_by_regime[src]
-        vals = [m.track_mm[b] for b in BLADES]
-        split = max(vals) - min(vals)
-        reg = _c(f"{name:<18}", REGIME_COLOR.get(src, "#000"))
-        lines.append(f"{reg}  {split:0.2f}")
+    for _name, reg, m in active:
+        t = m.track_mm
+        lines.append(f"{reg}  {t.max() - t.min():0.2f}")
 
     lines.append("")
     return "\n".join(lines)
 
 
-def legacy_results_html(run: int, meas_by_regime: Dict[str, Measurement]) -> str:
+def legacy_results_plain_text(
+    run: int,
+    meas_by_regime: Dict[str, Measurement],
+    display_points: Sequence[Tuple[str, str]] = DISPLAY_POINTS,
+) -> str:
+    """Same report as legacy_results_text but without HTML tags.
+
+    Useful for rendering inside Streamlit widgets like st.text_area where we
+    want a 'normal' textbox and reliable monospace alignment.
+    """
+
+    txt = legacy_results_text(run, meas_by_regime, display_points)
+    # Remove the inline <span ...> color wrappers.
+    return re.sub(r"</?span[^>]*>", "", txt)
+
+
+def legacy_results_html(
+    run: int,
+    meas_by_regime: Dict[str, Measurement],
+    display_points: Sequence[Tuple[str, str]] = DISPLAY_POINTS,
+) -> str:
     """HTML report used in the UI.
 
     Streamlit + HTML can sometimes collapse whitespace when inline spans are
@@ -181,7 +253,7 @@ def legacy_results_html(run: int, meas_by_regime: Dict[str, Measurement]) -> str
 
     # Build the classic mono text (with colored regime labels). We'll reuse it
     # for everything except the Adjustments block.
-    txt = legacy_results_text(run, meas_by_regime)
+    txt = legacy_results_text(run, meas_by_regime, display_points)
 
     # Split the report around the first "Adjustments" marker.
     marker = "\nAdjustments\n"
@@ -196,48 +268,19 @@ def legacy_results_html(run: int, meas_by_regime: Dict[str, Measurement]) -> str
     before, after = txt.split(marker, 1)
 
     # Recompute adjustments to render as a stable table.
-    pl = suggest_pitchlink(meas_by_regime)
-    tt = suggest_trimtabs(meas_by_regime)
-    wb, wg = suggest_weight(meas_by_regime)
-    wrow = {b: 0.0 for b in BLADES}
-    wrow[wb] = float(wg)
-
-    def td(text: str, *, color: str | None = None, bold: bool = False, w: int = 86) -> str:
-        style = [f"width:{w}px", "padding:2px 8px", "text-align:right", "white-space:pre"]
-        if color:
-            style.append(f"color:{color}")
-        if bold:
-            style.append("font-weight:700")
-        return f"<td style='{';'.join(style)}'>{text}</td>"
-
-    def th(text: str, color: str) -> str:
-        return td(text, color=color, bold=True)
-
-    def row(label: str, vals: Dict[str, float], fmt: str) -> str:
-        return (
-            "<tr>"
-            + f"<td style='width:140px; padding:2px 8px; text-align:left; white-space:pre; font-weight:700'>{label}</td>"
-            + td(format(vals['BLU'], fmt), color=BLADE_COLOR['BLU'])
-            + td(format(vals['GRN'], fmt), color=BLADE_COLOR['GRN'])
-            + td(format(vals['YEL'], fmt), color=BLADE_COLOR['YEL'])
-            + td(format(vals['RED'], fmt), color=BLADE_COLOR['RED'])
-            + "</tr>"
-        )
+    ms = MeasurementSet.from_dict(meas_by_regime)
+    pl = suggest_pitchlink(ms)
+    tt = suggest_trimtabs(ms)
+    wb, wg = suggest_weight(ms)
+    wrow = _weight_row(wb, wg)
 
+    tabs = tt * 0.8
     table = (
-        "<div style='margin-top:6px; margin-bottom:6px; font-weight:700;'>Adjustments</div>"
-        "<table style='border-collapse:collapse; font-family:Courier New,Consolas,monospace; font-size:14px;'>"
-        "<tr>"
-        "<td style='width:140px; padding:2px 8px; text-align:left; white-space:pre; font-weight:700'></td>"
-        + th("BLU", BLADE_COLOR["BLU"])
-        + th("GRN", BLADE_COLOR["GRN"])
-        + th("YEL", BLADE_COLOR["YEL"])
-        + th("RED", BLADE_COLOR["RED"])
-        + "</tr>"
-        + row("P/L(flats)", pl, "6.2f")
-        + row("TabS5(deg)", {b: tt[b] * 0.8 for b in BLADES}, "6.1f")
-        + row("TabS6(deg)", {b: tt[b] * 0.8 for b in BLADES}, "6.1f")
-        + row("Wt(plqts)", wrow, "6.0f")
+        _HTML_ADJ_HEAD
+        + _HTML_ADJ_ROW["P/L(flats)"].format(*pl.tolist())
+        + _HTML_ADJ_ROW["TabS5(deg)"].format(*tabs.tolist())
+        + _HTML_ADJ_ROW["TabS6(deg)"].format(*tabs.tolist())
+        + _HTML_ADJ_ROW["Wt(plqts)"].format(*wrow.tolist())
         + "</table>"
     )
 
@@ -1,11 +1,10 @@
 import math
-import random
 
 import numpy as np
 
-from .types import BalanceReading, Measurement
+from .types import BLADE_IDX, BLADES, BalanceReading, Measurement
 
-BLADES = ["BLU", "GRN", "YEL", "RED"]
+_YEL_IDX = BLADE_IDX["YEL"]
 
 # BO105 procedure set (training / simulator)
 # Only these regimes exist for the BO105 in this simulator:
@@ -19,12 +18,18 @@ REGIME_LABEL = {
     "HOVER": "Hover Flight",
     "HORIZ": "Horizontal Flight",
 }
+REGIME_LABELS = tuple(REGIME_LABEL[r] for r in REGIMES)
 
 BLADE_CLOCK_DEG = {"YEL": 0.0, "RED": 90.0, "BLU": 180.0, "GRN": 270.0}
 
 # BO105 — RPM de referencia en el simulador
 BO105_DISPLAY_RPM = 424.0
 
+# Generador de ruido de medida (un único draw por medición)
+_RNG = np.random.default_rng()
+# Desviación típica del ruido: 4 alturas de track (mm) + 2 componentes 1/rev (IPS)
+_NOISE_SIGMA = np.array([0.45, 0.45, 0.45, 0.45, 0.003, 0.003], dtype=np.float64)
+
 PITCHLINK_MM_PER_TURN = 10.0
 TRIMTAB_MMTRACK_PER_MM = 15.0
 BOLT_IPS_PER_GRAM = 0.0020
@@ -65,48 +70,71 @@ def default_adjustments():
     }
 
 
+# Clock angles are measured clockwise from 12 o'clock (+y): x = sin, y = cos,
+# and atan2(x, y) gives the clock angle directly.
 def _vec_from_clock_deg(theta_deg: float) -> np.ndarray:
-    phi = math.radians(90.0 - theta_deg)
-    return np.array([math.cos(phi), math.sin(phi)], dtype=float)
+    phi = math.radians(theta_deg)
+    return np.array([math.sin(phi), math.cos(phi)], dtype=float)
 
 
 def _clock_deg_from_vec(v: np.ndarray) -> float:
-    x, y = float(v[0]), float(v[1])
-    phi = math.degrees(math.atan2(y, x))
-    return (90.0 - phi) % 360.0
+    d = math.degrees(math.atan2(float(v[0]), float(v[1])))
+    return d if d >= 0.0 else d + 360.0
 
 
-def simulate_measurement(run: int, regime: str, adjustments: dict) -> Measurement:
-    adj = adjustments[regime]
-    base_track = RUN_BASE_TRACK.get(run, RUN_BASE_TRACK[3])[regime].copy()
-    base_amp, base_phase = RUN_BASE_BAL.get(run, RUN_BASE_BAL[3])[regime]
+# Unit 1/rev vectors of each blade, one row per blade (BLADES order).
+BLADE_CLOCK_VECS = np.stack([_vec_from_clock_deg(BLADE_CLOCK_DEG[b]) for b in BLADES])
+
+# Base 1/rev vector (amp * unit vector) of every (run, regime) in RUN_BASE_BAL.
+_BASE_BAL_VEC = {
+    (run, regime): _vec_from_clock_deg(phase) * float(amp)
+    for run, by_regime in RUN_BASE_BAL.items()
+    for regime, (amp, phase) in by_regime.items()
+}
+
 
-    track = {}
-    for b in BLADES:
-        pitch_effect = PITCHLINK_MM_PER_TURN * float(adj["pitch_turns"][b])
+_NO_TRIM = np.zeros(len(BLADES))
 
-        trim_effect = 0.0
-        # Trim tabs mainly affect the forward-flight regime in this simplified model.
-        if regime == "HORIZ":
-            trim_effect = TRIMTAB_MMTRACK_PER_MM * float(adj["trim_mm"][b])
 
-        noise = random.gauss(0.0, 0.45)
-        track[b] = float(base_track[b] + pitch_effect + trim_effect + noise)
+def _blade_array(values: dict) -> np.ndarray:
+    """Per-blade dict -> float64[4] in BLADES order."""
+    return np.asarray([float(values[b]) for b in BLADES], dtype=np.float64)
 
+
+def _sim_core(
+    base_track: np.ndarray,
+    pitch_turns: np.ndarray,
+    trim_mm: np.ndarray,
+    bolt_g: np.ndarray,
+    base_vec: np.ndarray,
+    noise: np.ndarray,
+):
+    """Pure numeric part of simulate_measurement -> (track[4], amp, phase).
+
+    All inputs are float64 arrays in BLADES order; trim_mm is already zero
+    outside the forward-flight regime.
+    """
+    track = base_track + PITCHLINK_MM_PER_TURN * pitch_turns + TRIMTAB_MMTRACK_PER_MM * trim_mm + noise[:4]
     # Normalize: track is always shown relative to YEL
-    yel0 = float(track["YEL"])
-    for b in BLADES:
-        track[b] = float(track[b] - yel0)
-    track["YEL"] = 0.0
+    track -= track[_YEL_IDX]
 
     # Simple 1/rev balance vector model
-    v = _vec_from_clock_deg(base_phase) * float(base_amp)
-    for b in BLADES:
-        grams = float(adj["bolt_g"][b])
-        v += (-BOLT_IPS_PER_GRAM * grams) * _vec_from_clock_deg(BLADE_CLOCK_DEG[b])
-    v += np.array([random.gauss(0.0, 0.003), random.gauss(0.0, 0.003)], dtype=float)
+    x, y = (base_vec + (-BOLT_IPS_PER_GRAM * bolt_g) @ BLADE_CLOCK_VECS + noise[4:]).tolist()
+    amp = math.hypot(x, y)
+    phase = _clock_deg_from_vec((x, y)) if amp > 1e-6 else 0.0
+    return track, amp, phase
+
+
+def simulate_measurement(run: int, regime: str, adjustments: dict) -> Measurement:
+    adj = adjustments[regime]
+    noise = _RNG.standard_normal(6) * _NOISE_SIGMA
+    base_track = _blade_array(RUN_BASE_TRACK.get(run, RUN_BASE_TRACK[3])[regime])
+    base_vec = _BASE_BAL_VEC[(run if run in RUN_BASE_BAL else 3, regime)]
 
-    amp = float(np.linalg.norm(v))
-    phase = float(_clock_deg_from_vec(v)) if amp > 1e-6 else 0.0
+    # Trim tabs mainly affect the forward-flight regime in this simplified model.
+    trim = _blade_array(adj["trim_mm"]) if regime == "HORIZ" else _NO_TRIM
 
+    track, amp, phase = _sim_core(
+        base_track, _blade_array(adj["pitch_turns"]), trim, _blade_array(adj["bolt_g"]), base_vec, noise
+    )
     return Measurement(regime=regime, balance=BalanceReading(amp, phase, BO105_DISPLAY_RPM), track_mm=track)
@@ -1,19 +1,26 @@
-import math
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 
-from .types import Measurement
+import numpy as np
 
-BLADES = ["BLU", "GRN", "YEL", "RED"]
+from .types import BLADES, Measurement, MeasurementSet
+
+# Solver entry points take the UI's regime-keyed dict or a MeasurementSet.
+Measurements = Union[Dict[str, Measurement], MeasurementSet]
 
 # Keep in sync with vxp.sim.REGIMES
 REGIMES = ["GROUND", "HOVER", "HORIZ"]
 
 BLADE_CLOCK_DEG = {"YEL": 0.0, "RED": 90.0, "BLU": 180.0, "GRN": 270.0}
+BLADE_CLOCK_DEG_ARR = np.array([BLADE_CLOCK_DEG[b] for b in BLADES])
 
 PITCHLINK_MM_PER_TURN = 10.0
 TRIMTAB_MMTRACK_PER_MM = 15.0
 BOLT_IPS_PER_GRAM = 0.0020
 
+# Inverses so the suggestions multiply instead of divide
+_INV_PL = 1.0 / PITCHLINK_MM_PER_TURN
+_INV_TT = 1.0 / TRIMTAB_MMTRACK_PER_MM
+
 
 def track_limit(regime: str) -> float:
     # Ground run is more permissive; hover and horizontal are tighter.
@@ -92,66 +99,77 @@ def regime_status(regime: str, m: Measurement | None) -> str | None:
 
 
 def track_spread(m: Measurement) -> float:
-    vals = [m.track_mm[b] for b in BLADES]
-    return float(max(vals) - min(vals))
+    t = m.track_mm
+    return float(t.max() - t.min())
+
+
+# Per-regime limits as lookups for all_ok (the limit functions are constant per regime).
+_TRACK_LIMIT = {r: track_limit(r) for r in REGIMES}
+_BALANCE_LIMIT = {r: balance_limit(r) for r in REGIMES}
+
 
+def _as_set(meas: Measurements) -> MeasurementSet:
+    return meas if isinstance(meas, MeasurementSet) else MeasurementSet.from_dict(meas)
 
-def all_ok(meas_by_regime: Dict[str, Measurement]) -> bool:
-    for r in REGIMES:
-        if r not in meas_by_regime:
+
+def all_ok(meas_by_regime: Measurements) -> bool:
+    ms = _as_set(meas_by_regime)
+    for r, m in (("GROUND", ms.ground), ("HOVER", ms.hover), ("HORIZ", ms.horiz)):
+        if m is None:
             return False
-        if track_spread(meas_by_regime[r]) > track_limit(r):
+        # Cheapest check first: a scalar compare before the track spread.
+        if m.balance.amp_ips > _BALANCE_LIMIT[r]:
             return False
-        if meas_by_regime[r].balance.amp_ips > balance_limit(r):
+        t = m.track_mm
+        if t.max() - t.min() > _TRACK_LIMIT[r]:
             return False
     return True
 
 
-def _round_quarter(x: float) -> float:
-    return round(x * 4.0) / 4.0
+def _round_quarter(x):
+    """Round to the nearest 0.25 (ties go up). Works on floats and arrays.
+
+    floor(x + 0.5) never yields -0.0, so reports never print "-0.00".
+    """
+    return np.floor(x * 4.0 + 0.5) * 0.25
 
 
-def suggest_pitchlink(meas: Dict[str, Measurement]) -> Dict[str, float]:
+def suggest_pitchlink(meas: Measurements) -> np.ndarray:
+    """Pitch-link turns per blade (float64[4], BLADES order)."""
+    ms = _as_set(meas)
     # Primary pitch-link adjustment is based on ground + hover.
-    used = [r for r in ("GROUND", "HOVER") if r in meas]
+    used = [m.track_mm for m in (ms.ground, ms.hover) if m is not None]
     if not used:
-        return {b: 0.0 for b in BLADES}
-    out = {}
-    for b in BLADES:
-        avg = sum(meas[r].track_mm[b] for r in used) / len(used)
-        out[b] = _round_quarter((-avg) / PITCHLINK_MM_PER_TURN)
-    return out
+        return np.zeros(len(BLADES))
+    avg = np.stack(used).mean(axis=0)
+    return _round_quarter(-avg * _INV_PL)
 
 
-def suggest_trimtabs(meas: Dict[str, Measurement]) -> Dict[str, float]:
+def suggest_trimtabs(meas: Measurements) -> np.ndarray:
     """Suggest trim-tab bending based on Horizontal Flight.
 
     In this simplified BO105 workflow, Horizontal Flight is the only
-    forward-flight regime.
+    forward-flight regime. Returns float64[4] in BLADES order.
     """
-    if "HORIZ" not in meas:
-        return {b: 0.0 for b in BLADES}
-    out = {}
-    for b in BLADES:
-        dev = meas["HORIZ"].track_mm[b]
-        out[b] = max(-5.0, min(5.0, _round_quarter((-dev) / TRIMTAB_MMTRACK_PER_MM)))
-    return out
+    horiz = _as_set(meas).horiz
+    if horiz is None:
+        return np.zeros(len(BLADES))
+    return np.clip(_round_quarter(-horiz.track_mm * _INV_TT), -5.0, 5.0)
 
 
-def suggest_weight(meas: Dict[str, Measurement]) -> Tuple[str, float]:
-    if not meas:
+def suggest_weight(meas: Measurements) -> Tuple[str, float]:
+    present = _as_set(meas).present()
+    if not present:
         return ("YEL", 0.0)
 
-    worst_r = max(meas.keys(), key=lambda r: meas[r].balance.amp_ips)
-    m = meas[worst_r]
-    amp = m.balance.amp_ips
-    phase = m.balance.phase_deg
+    # Worst (highest 1P amplitude) regime; first one in regime order wins on ties.
+    bal = present[int(np.argmax([m.balance.amp_ips for m in present]))].balance
+    amp = bal.amp_ips
+    phase = bal.phase_deg
     target = (phase + 180.0) % 360.0
 
-    def dist(a, b):
-        d = abs(a - b) % 360.0
-        return min(d, 360.0 - d)
-
-    blade = min(BLADES, key=lambda bb: dist(target, BLADE_CLOCK_DEG[bb]))
+    # Blade closest (angular distance) to the point opposite the heavy spot.
+    d = np.abs(target - BLADE_CLOCK_DEG_ARR) % 360.0
+    blade = BLADES[int(np.argmin(np.minimum(d, 360.0 - d)))]
     grams = max(5.0, min(120.0, round(amp / BOLT_IPS_PER_GRAM / 5.0) * 5.0))
     return blade, grams
@@ -7,6 +7,7 @@ across Streamlit versions.
 from __future__ import annotations
 
 import base64
+import re
 from pathlib import Path
 
 
@@ -14,17 +15,41 @@ def _b64(path: Path) -> str:
     return base64.b64encode(path.read_bytes()).decode("ascii")
 
 
+def _minify_css(css: str) -> str:
+    """Strip comments and layout whitespace (done once, at import).
+
+    Streamlit drops elements that are not re-emitted on a rerun, so the
+    stylesheet has to be sent every time; keep that payload small instead.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,])\s*", r"\1", css).strip()
+
+
 _ASSET_BG = Path(__file__).parent / "assets" / "backgrounds" / "rugged_tablet.png"
 BG_B64 = _b64(_ASSET_BG) if _ASSET_BG.exists() else ""
 
 
-XP_CSS = (
+XP_CSS = _minify_css(
     r"""
 <style>
 /* ---- Hide Streamlit chrome ---- */
 [data-testid="stHeader"], [data-testid="stToolbar"], #MainMenu { display:none !important; }
 footer { visibility:hidden; }
 
+/* ---- Disable Streamlit fade/transition artifacts ----
+   Streamlit sometimes fades out replaced elements on reruns.
+   In our fixed 1024×768 desktop this can look like a 'ghost' copy
+   of the previous window that slowly fades out (the issue you reported).
+   We disable animations/transitions inside the app view.
+*/
+div[data-testid="stAppViewContainer"] *,
+div[data-testid="stAppViewContainer"] *::before,
+div[data-testid="stAppViewContainer"] *::after{
+  transition:none !important;
+  animation:none !important;
+}
+
 /* ---- Global look (Windows XP-ish) ---- */
 /* The page background simulates a ruggedized tablet around the 1024×768 screen. */
 html, body, [data-testid="stAppViewContainer"]{
@@ -131,7 +156,7 @@ html, body, [data-testid="stAppViewContainer"]{
 div[data-testid="stAppViewContainer"] .block-container div.element-container{ margin-bottom:0 !important; margin-top:0 !important; }
 
 /* ---- Left smart icon bar ---- */
-.vxp-toolbar-img{ width:81px; padding:0; margin:0; }
+.vxp-toolbar-img{ width:81px; padding:0; margin:0; display:flex; flex-direction:column; gap:1rem; }
 .vxp-imgbtn{ display:block; margin:6px 0; text-decoration:none; }
 .vxp-imgbtn img{ width:81px; height:auto; image-rendering: pixelated; }
 .vxp-imgbtn.disabled{ opacity:0.75; pointer-events:none; }
@@ -245,6 +270,20 @@ div[data-testid="stSelectbox"] div[role="combobox"]{
   font-weight:700 !important;
 }
 
+/* Text areas (reports) */
+div[data-testid="stTextArea"] textarea{
+  border-radius:0px !important;
+  border-top:2px solid #ffffff !important;
+  border-left:2px solid #ffffff !important;
+  border-right:2px solid #404040 !important;
+  border-bottom:2px solid #404040 !important;
+  background:#ffffff !important;
+  font-family:"Courier New", Consolas, monospace !important;
+  font-weight:700 !important;
+  font-size:14px !important;
+  line-height:1.15 !important;
+}
+
 /* Mono text blocks */
 .vxp-mono{
   font-family: "Courier New", Consolas, monospace;
@@ -270,3 +309,23 @@ div[data-testid="stSelectbox"] div[role="combobox"]{
 </style>
 """
 ).replace("__BG__", BG_B64)
+
+
+# Compact selectboxes for the MEASUREMENTS GRAPH screen only (Streamlit defaults
+# are too tall for XGA). The screen emits it on each render, so it disappears
+# together with the screen.
+MEAS_GRAPH_CSS = _minify_css(
+    r"""
+<style>
+div[data-testid="stVerticalBlockBorderWrapper"] div[data-testid="stSelectbox"] div[role="combobox"]{
+  min-height:24px !important;
+  height:24px !important;
+  font-size:11px !important;
+}
+div[data-testid="stVerticalBlockBorderWrapper"] div[data-testid="stSelectbox"] div[role="combobox"] > div{
+  padding-top:0 !important;
+  padding-bottom:0 !important;
+}
+</style>
+"""
+)
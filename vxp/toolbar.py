@@ -18,10 +18,9 @@ def _b64_png(path: Path) -> str:
     data = path.read_bytes()
     return base64.b64encode(data).decode("ascii")
 
+@st.cache_data(show_spinner=False)
 def get_toolbar_b64() -> dict:
-    if "vxp_toolbar_b64" in st.session_state:
-        return st.session_state.vxp_toolbar_b64
-
+    # Same icons for every session: cache once per process, not per session.
     base = Path(__file__).parent / "assets" / "toolbar"
     out = {}
     for key, filename, _, _ in TOOLBAR_ITEMS:
@@ -30,12 +29,12 @@ def get_toolbar_b64() -> dict:
             out[key] = _b64_png(p)
         else:
             out[key] = ""  # si falta el archivo, no rompe
-    st.session_state.vxp_toolbar_b64 = out
     return out
 
-def render_toolbar(interactive: bool = False) -> None:
+@st.cache_data(show_spinner=False)
+def _toolbar_html(interactive: bool) -> str:
     icons = get_toolbar_b64()
-    st.markdown("<div class='vxp-toolbar-img'>", unsafe_allow_html=True)
+    parts = ["<div class='vxp-toolbar-img'>"]
 
     for key, _, nav, disabled in TOOLBAR_ITEMS:
         b64 = icons.get(key, "")
@@ -45,8 +44,13 @@ def render_toolbar(interactive: bool = False) -> None:
 
         # Por defecto se pinta como "solo imagen" (sin navegación)
         if (not interactive) or disabled or (not nav):
-            st.markdown(f"<div class='vxp-imgbtn disabled'>{img}</div>", unsafe_allow_html=True)
+            parts.append(f"<div class='vxp-imgbtn disabled'>{img}</div>")
         else:
-            st.markdown(f"<a class='vxp-imgbtn' href='?nav={nav}'>{img}</a>", unsafe_allow_html=True)
+            parts.append(f"<a class='vxp-imgbtn' href='?nav={nav}'>{img}</a>")
 
-    st.markdown("</div>", unsafe_allow_html=True)
+    parts.append("</div>")
+    return "".join(parts)
+
+def render_toolbar(interactive: bool = False) -> None:
+    # Un único bloque HTML: un solo mensaje por rerun para toda la barra.
+    st.markdown(_toolbar_html(interactive), unsafe_allow_html=True)
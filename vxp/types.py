@@ -1,14 +1,73 @@
-from dataclasses import dataclass
-from typing import Dict
-
-@dataclass
-class BalanceReading:
-    amp_ips: float
-    phase_deg: float
-    rpm: float
-
-@dataclass
-class Measurement:
-    regime: str
-    balance: BalanceReading
-    track_mm: Dict[str, float]  # BLU/GRN/YEL/RED relative to YEL
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Fixed blade order of Measurement.track_mm
+BLADES = ("BLU", "GRN", "YEL", "RED")
+BLADE_IDX = {b: i for i, b in enumerate(BLADES)}
+
+@dataclass(slots=True, frozen=True)
+class BalanceReading:
+    amp_ips: float
+    phase_deg: float
+    rpm: float
+
+# eq=False: generated __eq__/__hash__ would compare the ndarray field and fail;
+# use measurement_key() below for value comparison / cache keys.
+@dataclass(slots=True, frozen=True, eq=False)
+class Measurement:
+    regime: str
+    balance: BalanceReading
+    track_mm: np.ndarray  # float64[4] BLU/GRN/YEL/RED (BLADES order) relative to YEL
+
+@dataclass(slots=True)
+class MeasurementSet:
+    """One run's measurements in fixed regime slots (None = not collected).
+
+    Internal counterpart of the Dict[str, Measurement] keyed by
+    GROUND/HOVER/HORIZ that the UI keeps in session state.
+    """
+    ground: Optional[Measurement] = None
+    hover: Optional[Measurement] = None
+    horiz: Optional[Measurement] = None
+
+    @classmethod
+    def from_dict(cls, meas_by_regime: Dict[str, Measurement]) -> "MeasurementSet":
+        return cls(meas_by_regime.get("GROUND"), meas_by_regime.get("HOVER"), meas_by_regime.get("HORIZ"))
+
+    def to_dict(self) -> Dict[str, Measurement]:
+        slots = (("GROUND", self.ground), ("HOVER", self.hover), ("HORIZ", self.horiz))
+        return {r: m for r, m in slots if m is not None}
+
+    def present(self) -> List[Measurement]:
+        """Collected measurements in GROUND, HOVER, HORIZ order."""
+        return [m for m in (self.ground, self.hover, self.horiz) if m is not None]
+
+
+@dataclass(slots=True)
+class AircraftInfo:
+    """AIRCRAFT INFO dialog fields (session state vxp_aircraft)."""
+    weight: float = 0.0
+    cg: float = 0.0
+    hours: float = 0.0
+    initials: str = ""
+
+
+# Hashable fingerprints of measurements, used as cache keys (plots, UI).
+def measurement_key(m: Measurement) -> tuple:
+    b = m.balance
+    return (m.regime, b.amp_ips, b.phase_deg, b.rpm, tuple(m.track_mm.tolist()))
+
+
+def regimes_key(meas_by_regime: Dict[str, Measurement]) -> Tuple[tuple, ...]:
+    return tuple((r, measurement_key(m)) for r, m in sorted(meas_by_regime.items()))
+
+
+def measurement_from_key(key: tuple) -> Measurement:
+    regime, amp, phase, rpm, track = key
+    return Measurement(regime=regime, balance=BalanceReading(amp, phase, rpm), track_mm=np.array(track, dtype=float))
+
+
+def regimes_from_key(key: tuple) -> Dict[str, Measurement]:
+    return {r: measurement_from_key(mk) for r, mk in key}
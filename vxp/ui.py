@@ -1,5 +1,8 @@
+import bisect
+import inspect
 import time
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
 
 import streamlit as st
 
@@ -7,13 +10,15 @@ from .sim import (
     BLADES,
     REGIMES,
     REGIME_LABEL,
+    REGIME_LABELS,
     BO105_DISPLAY_RPM,
     default_adjustments,
     simulate_measurement,
 )
-from .reports import legacy_results_text, legacy_results_html, clock_label
-from .plots import plot_measurements_panel, plot_track_marker, plot_track_graph, plot_polar, plot_polar_compare
+from .reports import legacy_results_plain_text, legacy_results_html, clock_label
 from .solver import all_ok, regime_status
+from .styles import MEAS_GRAPH_CSS
+from .types import AircraftInfo, Measurement, regimes_from_key, regimes_key
 
 
 def _status_icon_html(status: str | None) -> str:
@@ -72,64 +77,125 @@ def go(screen: str, **kwargs) -> None:
         st.session_state[k] = v
 
 
-def init_state() -> None:
-    st.session_state.setdefault("vxp_screen", "home")
-    st.session_state.setdefault("vxp_run", 1)
-    st.session_state.setdefault("vxp_runs", {1: {}})
-    st.session_state.setdefault("vxp_completed_by_run", {1: set()})
-    st.session_state.setdefault("vxp_view_run", 1)
+# Initial session state: one factory per key, so every session gets its own objects.
+_STATE_DEFAULTS: Dict[str, Callable[[], object]] = {
+    "vxp_screen": lambda: "home",
+    "vxp_run": lambda: 1,
+    "vxp_runs": lambda: {1: {}},
+    "vxp_completed_by_run": lambda: {1: 0},
+    "vxp_view_run": lambda: 1,
+    "vxp_adjustments": default_adjustments,
+    "vxp_pending_regime": lambda: None,
+    "vxp_acq_in_progress": lambda: False,
+    "vxp_acq_start_ts": lambda: None,
+    "vxp_acq_done": lambda: False,
+    # Aircraft Info / Note Codes (legacy dialogs)
+    "vxp_aircraft": AircraftInfo,
+    "vxp_note_codes": int,  # bitmask: bit c = note code c selected
+}
 
-    st.session_state.setdefault("vxp_adjustments", default_adjustments())
-    st.session_state.setdefault("vxp_pending_regime", None)
-    st.session_state.setdefault("vxp_acq_in_progress", False)
-    st.session_state.setdefault("vxp_acq_done", False)
 
-    # Aircraft Info / Note Codes (legacy dialogs)
-    st.session_state.setdefault(
-        "vxp_aircraft",
-        {
-            "weight": 0.0,
-            "cg": 0.0,
-            "hours": 0.0,
-            "initials": "",
-        },
-    )
-    st.session_state.setdefault("vxp_note_codes", set())
+def init_state() -> None:
+    ss = st.session_state
+    # All keys are seeded together on the first run; later reruns only pay this check.
+    if "vxp_state_ready" in ss:
+        return
+    for k, make in _STATE_DEFAULTS.items():
+        if k not in ss:
+            ss[k] = make()
+    # Run numbers in ascending order, kept in sync by ensure_run (selectors read it as-is).
+    if "vxp_runs_sorted" not in ss:
+        ss.vxp_runs_sorted = sorted(ss.vxp_runs)
+    ss.vxp_state_ready = True
 
 
 def current_run_data(run: int):
     return st.session_state.vxp_runs.setdefault(run, {})
 
 
-def completed_set(run: int):
-    return st.session_state.vxp_completed_by_run.setdefault(run, set())
+# Regímenes completados por run como máscara de bits (bit i = REGIMES[i]).
+_REGIME_BIT = {r: 1 << i for i, r in enumerate(REGIMES)}
+_ALL_REGIMES_MASK = (1 << len(REGIMES)) - 1
 
 
-def run_selector_inline(key: str = "run_selector") -> int:
-    runs = sorted(st.session_state.vxp_runs.keys())
+def completed_mask(run: int) -> int:
+    return st.session_state.vxp_completed_by_run.setdefault(run, 0)
+
+
+def mark_completed(run: int, regime: str) -> None:
+    st.session_state.vxp_completed_by_run[run] = completed_mask(run) | _REGIME_BIT[regime]
+
+
+def ensure_run(run: int) -> None:
+    """Register a run (data, completed mask and the sorted run list)."""
+    st.session_state.vxp_runs.setdefault(run, {})
+    st.session_state.vxp_completed_by_run.setdefault(run, 0)
+    runs = st.session_state.vxp_runs_sorted
+    i = bisect.bisect_left(runs, run)
+    if i == len(runs) or runs[i] != run:
+        runs.insert(i, run)
+
+
+def _view_run_index(runs) -> int:
+    """Index of vxp_view_run in the sorted run list (resets to the first run if missing)."""
     cur = int(st.session_state.vxp_view_run)
-    if cur not in runs:
-        cur = runs[0]
-        st.session_state.vxp_view_run = cur
-    idx = runs.index(cur)
-    r = st.selectbox("Run", runs, index=idx, key=key)
+    idx = bisect.bisect_left(runs, cur)
+    if idx == len(runs) or runs[idx] != cur:
+        idx = 0
+        st.session_state.vxp_view_run = runs[0]
+    return idx
+
+
+def run_selector_inline(key: str = "run_selector") -> int:
+    runs = st.session_state.vxp_runs_sorted
+    r = st.selectbox("Run", runs, index=_view_run_index(runs), key=key)
     st.session_state.vxp_view_run = int(r)
     return int(r)
 
 
+# Report text per (run, measurements fingerprint): toggling a selector or
+# navigating back re-renders the screen without re-formatting the report.
+# A new measurement changes the fingerprint, so stale entries are never hit.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_report_plain(run: int, data_key: tuple) -> str:
+    return legacy_results_plain_text(run, regimes_from_key(data_key))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_report_html(run: int, data_key: tuple) -> str:
+    return legacy_results_html(run, regimes_from_key(data_key))
+
+
 # ---------------------------
 # Window chrome helpers
 # ---------------------------
 
-def win_caption(title: str, active: bool) -> None:
-    cls = "active" if active else "inactive"
-    st.markdown(
-        f"<div class='vxp-win-caption {cls}'>"
-        f"<div>{title}</div>"
-        "<div class='vxp-closebox'>✕</div>"
-        "</div>",
-        unsafe_allow_html=True,
-    )
+# Plantillas de la barra de título (activa / inactiva), montadas una sola vez.
+_WIN_CAPTION_TPL = {
+    active: f"<div class='vxp-win-caption {cls}'{{style}}><div>{{t}}</div><div class='vxp-closebox'>✕</div></div>"
+    for active, cls in ((True, "active"), (False, "inactive"))
+}
+
+
+@lru_cache(maxsize=64)
+def _caption_html(title: str, active: bool, space: int) -> str:
+    style = f" style='margin-bottom:{space}px;'" if space else ""
+    return _WIN_CAPTION_TPL[active].format(t=title, style=style)
+
+
+def win_caption(title: str, active: bool, space: int = 0) -> None:
+    # space: hueco (px) bajo la barra de título, en el mismo mensaje en vez de un spacer aparte.
+    st.markdown(_caption_html(title, bool(active), space), unsafe_allow_html=True)
+
+
+# Todo lo que no sea alfanumérico pasa a "_" en las claves de widget (tabla C, sin bucle Python).
+_KEY_SLUG_TABLE = str.maketrans({c: "_" for c in map(chr, range(256)) if not c.isalnum()})
+
+
+@lru_cache(maxsize=512)
+def _widget_key(screen: str, text: str, suffix: str = "") -> str:
+    """Stable explicit widget key: btn_<screen>_<slug(text)><suffix>."""
+    return f"btn_{screen}_{text.translate(_KEY_SLUG_TABLE)}{suffix}"
 
 
 def right_close_button(
@@ -138,26 +204,37 @@ def right_close_button(
     target: str | None = None,
     on_click: Callable[[], None] | None = None,
     key: str | None = None,
+    full_rerun: bool = False,
 ) -> None:
     """Classic right-aligned button (usually Close).
 
     Streamlit can raise StreamlitDuplicateElementKey when multiple elements
     end up with the same implicit key. To make the app robust across Streamlit
     versions and navigation patterns, we always provide an explicit key.
+
+    The action runs as an on_click callback, i.e. before the rerun the click
+    triggers, so the next screen is drawn by that same rerun. Inside a fragment
+    the click only reruns the fragment: pass full_rerun=True there.
     """
     screen = str(st.session_state.get("vxp_screen", ""))
     if key is None:
-        safe = "".join(ch if ch.isalnum() else "_" for ch in label.lower())
-        key = f"btn_{screen}_{safe}_right"
+        key = _widget_key(screen, label.lower(), "_right")
 
     cols = st.columns([0.75, 0.25])
     with cols[1]:
-        if st.button(label, use_container_width=True, key=key):
-            if target is not None:
-                go(target)
-            if on_click is not None:
-                on_click()
-            st.rerun()
+        if full_rerun:
+            if st.button(label, use_container_width=True, key=key):
+                _run_actions(target, on_click)
+                st.rerun()
+        else:
+            st.button(label, use_container_width=True, key=key, on_click=_run_actions, args=(target, on_click))
+
+
+def _run_actions(target: str | None, on_click: Callable[[], None] | None) -> None:
+    if target is not None:
+        go(target)
+    if on_click is not None:
+        on_click()
 
 
 """UI rendering.
@@ -174,6 +251,11 @@ Nota importante sobre Streamlit:
 # Desktop (single-window)
 # ---------------------------
 
+# st.container(border=...) only exists on newer Streamlit builds: probe the
+# signature once at import instead of try/except on every rerun.
+_DESK_CONTAINER_KWARGS = {"border": True} if "border" in inspect.signature(st.container).parameters else {}
+
+
 def render_desktop() -> None:
     """Render a single main window (no overlapping popups)."""
 
@@ -183,12 +265,7 @@ def render_desktop() -> None:
     #
     # We instead use a real Streamlit container (optionally with border=True)
     # and skin that container via CSS.
-    try:
-        desk = st.container(border=True)
-    except TypeError:
-        desk = st.container()
-
-    with desk:
+    with st.container(**_DESK_CONTAINER_KWARGS):
         # Marker used by CSS (safe even if :has is not available).
         st.markdown("<div class='vxp-desktop-marker'></div>", unsafe_allow_html=True)
 
@@ -199,69 +276,27 @@ def render_desktop() -> None:
 
 
 def render_select_procedure_window(active: bool) -> None:
-    win_caption("Select Procedure:", active=active)
-    st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
+    win_caption("Select Procedure:", active=active, space=8)
 
     # (3) Botones centrados como en el VXP original (lista central, sin columna vacía gigante)
     pad_l, mid, pad_r = st.columns([0.14, 0.72, 0.14], gap="small")
 
     with mid:
-        if st.button("Aircraft Info", use_container_width=True, key="home_aircraft_info"):
-            go("aircraft_info")
-            st.rerun()
-        if st.button("Main Rotor Balance Run 1", use_container_width=True, key="home_mr_run1"):
-            go("mr_menu")
-            st.rerun()
+        st.button("Aircraft Info", use_container_width=True, key="home_aircraft_info", on_click=go, args=("aircraft_info",))
+        st.button("Main Rotor Balance Run 1", use_container_width=True, key="home_mr_run1", on_click=go, args=("mr_menu",))
 
         # (4) En el original solo aparece Tail Rotor Balance Run 1.
-        if st.button("Tail Rotor Balance Run 1", use_container_width=True, key="home_tr_run1"):
-            go("not_impl")
-            st.rerun()
-
-        if st.button("T/R Driveshaft Balance Run 1", use_container_width=True, key="home_drv_run1"):
-            go("not_impl")
-            st.rerun()
-        if st.button("Vibration Signatures", use_container_width=True, key="home_vib_sig"):
-            go("not_impl")
-            st.rerun()
-        if st.button("Measurements Only", use_container_width=True, key="home_meas_only"):
-            go("not_impl")
-            st.rerun()
-        if st.button("Setup / Utilities", use_container_width=True, key="home_setup_utils"):
-            go("not_impl")
-            st.rerun()
+        st.button("Tail Rotor Balance Run 1", use_container_width=True, key="home_tr_run1", on_click=go, args=("not_impl",))
+
+        st.button("T/R Driveshaft Balance Run 1", use_container_width=True, key="home_drv_run1", on_click=go, args=("not_impl",))
+        st.button("Vibration Signatures", use_container_width=True, key="home_vib_sig", on_click=go, args=("not_impl",))
+        st.button("Measurements Only", use_container_width=True, key="home_meas_only", on_click=go, args=("not_impl",))
+        st.button("Setup / Utilities", use_container_width=True, key="home_setup_utils", on_click=go, args=("not_impl",))
 
 
 def render_active_window() -> None:
-    screen = st.session_state.vxp_screen
-    if screen == "mr_menu":
-        screen_mr_menu_window()
-    elif screen == "collect":
-        screen_collect_window()
-    elif screen == "acquire":
-        # Backward compatibility: older builds navigated to an explicit
-        # ACQUIRE screen. We now render acquisition as a modal inside COLLECT
-        # to avoid duplicate button panes.
-        go("collect")
-        st.rerun()
-    elif screen == "meas_list":
-        screen_meas_list_window()
-    elif screen == "meas_graph":
-        screen_meas_graph_window()
-    elif screen == "settings":
-        screen_settings_window()
-    elif screen == "solution":
-        screen_solution_window()
-    elif screen == "solution_text":
-        screen_solution_text_window()
-    elif screen == "next_run_prompt":
-        screen_next_run_window()
-    elif screen == "aircraft_info":
-        screen_aircraft_info_window()
-    elif screen == "note_codes":
-        screen_note_codes_window()
-    else:
-        screen_not_impl_window()
+    # Dispatch table is defined at the bottom of the module (after the screens).
+    _SCREEN_DISPATCH.get(st.session_state.vxp_screen, screen_not_impl_window)()
 
 
 # ---------------------------
@@ -275,25 +310,20 @@ def _centered_buttons(labels_and_targets):
         for label, target in labels_and_targets:
             # Explicit key avoids StreamlitDuplicateElementKey on some builds.
             screen = str(st.session_state.get("vxp_screen", ""))
-            safe_t = "".join(ch if ch.isalnum() else "_" for ch in str(target))
-            k = f"btn_{screen}_{safe_t}"
-            if st.button(label, use_container_width=True, key=k):
-                go(target)
-                st.rerun()
+            k = _widget_key(screen, str(target))
+            st.button(label, use_container_width=True, key=k, on_click=go, args=(target,))
 
 
 def screen_mr_menu_window():
     run = int(st.session_state.vxp_run)
-    win_caption(f"Main Rotor Balance Run {run}", active=True)
-    st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
+    win_caption(f"Main Rotor Balance Run {run}", active=True, space=10)
     st.markdown(
-        "<div style='display:flex; justify-content:space-between; font-weight:900;'>"
+        "<div style='display:flex; justify-content:space-between; font-weight:900; margin-bottom:10px;'>"
         "<div>Tracking &amp; Balance – Option B</div>"
         f"<div>Run {run}</div>"
         "</div>",
         unsafe_allow_html=True,
     )
-    st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
 
     _centered_buttons(
         [
@@ -307,156 +337,244 @@ def screen_mr_menu_window():
     )
 
     st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-    right_close_button("Close", on_click=lambda: go("home"))
+    right_close_button("Close", target="home")
+
+
+@lru_cache(maxsize=64)
+def _regime_keys(prefix: str, run: int) -> Tuple[str, ...]:
+    """Widget keys of the per-regime buttons, in REGIMES order."""
+    return tuple(f"{prefix}_{run}_{r}" for r in REGIMES)
+
+
+# Status cell to the right of each regime button (40px, icon centred).
+_ICON_CELL = "<div style='height:40px; display:flex; align-items:center; justify-content:center;'>{}</div>"
+_EMPTY_ICON_CELL = _ICON_CELL.format("")
+
+
+def _regime_icon_cell(regime: str, data: dict, done: int) -> str:
+    # Only collected regimes get a status symbol; skip the solver for the rest.
+    if not done & _REGIME_BIT[regime]:
+        return _EMPTY_ICON_CELL
+    return _ICON_CELL.format(_status_icon_html(regime_status(regime, data.get(regime))))
+
+
+def _open_acquire(regime: str, already_taken: bool) -> None:
+    ss = st.session_state
+    ss.vxp_pending_regime = regime
+    ss.vxp_acq_in_progress = False
+    ss.vxp_acq_done = already_taken
+
+
+def _close_acquire(target: str | None = None) -> None:
+    ss = st.session_state
+    ss.vxp_pending_regime = None
+    ss.vxp_acq_in_progress = False
+    ss.vxp_acq_done = False
+    if target is not None:
+        go(target)
 
 
 def screen_collect_window():
-    run = int(st.session_state.vxp_run)
+    ss = st.session_state
+    run = int(ss.vxp_run)
+    # When a regime is selected, we show the acquisition dialog to the right
+    # **without changing screen**. This prevents rendering the COLLECT list twice
+    # (a common Streamlit layout pitfall) and matches the legacy feel.
+    pending = ss.get("vxp_pending_regime")
 
-    pending = st.session_state.get("vxp_pending_regime")
     data = current_run_data(run)
-    done = completed_set(run)
-
-    # ✅ CORRECTO: si no hay pending, no se crean columnas dobles
-    if pending:
-        left, right = st.columns([0.44, 0.56], gap="medium")
-    else:
-        left = st.container()
-        right = None
+    done = completed_mask(run)
+
+    # IMPORTANT (Streamlit): keep a stable layout path between reruns.
+    # If we switch between st.container() and st.columns(), Streamlit can
+    # leave the previous layout on the page, producing a duplicated (faded)
+    # button pane like the one you reported. We always render the same
+    # two-column structure and simply leave the right column empty when
+    # no regime is being acquired.
+    left, right = st.columns([0.44, 0.56], gap="medium")
 
     # ---------------- Left: COLLECT list ----------------
     with left:
         win_caption(f"RPM  {BO105_DISPLAY_RPM:.1f}", active=(pending is None))
         st.markdown(
-            f"<div class='vxp-label' style='margin-top:8px;'>Main Rotor: Run {run} &nbsp;&nbsp;&nbsp; Day Mode</div>",
+            f"<div class='vxp-label' style='margin:8px 0 10px;'>Main Rotor: Run {run} &nbsp;&nbsp;&nbsp; Day Mode</div>",
             unsafe_allow_html=True,
         )
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
 
+        # While the acquisition dialog is open, keep the list visible but disable
+        # the buttons (legacy behaved like a modal dialog).
         disable_list = pending is not None
 
-        for r in REGIMES:
+        for r, label, key in zip(REGIMES, REGIME_LABELS, _regime_keys("reg", run)):
             cols = st.columns([0.84, 0.16])
             with cols[0]:
-                if st.button(
-                    REGIME_LABEL[r],
+                st.button(
+                    label,
                     use_container_width=True,
-                    disabled=disable_list or (r in done),
-                    key=f"reg_{run}_{r}",
-                ):
-                    st.session_state.vxp_pending_regime = r
-                    st.session_state.vxp_acq_in_progress = False
-                    st.session_state.vxp_acq_done = (r in done)
-                    st.rerun()
-
-            with cols[1]:
-                icon = _status_icon_html(regime_status(r, data.get(r)))
-                st.markdown(
-                    "<div style='height:40px; display:flex; align-items:center; justify-content:center;'>"
-                    + (icon if r in done else "")
-                    + "</div>",
-                    unsafe_allow_html=True,
+                    disabled=disable_list,
+                    key=key,
+                    on_click=_open_acquire,
+                    args=(r, bool(done & _REGIME_BIT[r])),
                 )
+            with cols[1]:
+                st.markdown(_regime_icon_cell(r, data, done), unsafe_allow_html=True)
+
+        if run == 3 and done == _ALL_REGIMES_MASK and all_ok(data):
+            st.markdown(
+                "<div class='vxp-label' style='margin-top:10px;'>✓ RUN 3 COMPLETE — PARAMETERS OK</div>",
+                unsafe_allow_html=True,
+            )
 
-        # ✅ Close solo si NO hay adquisición activa
+        # Only show COLLECT Close when not in the modal acquisition dialog.
         if pending is None:
             st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-            right_close_button("Close", on_click=lambda: go("mr_menu"))
+            right_close_button("Close", target="mr_menu")
 
     # ---------------- Right: Acquisition dialog (modal) ----------------
-    if pending and right is not None:
+    if pending:
         with right:
             _render_acquire_dialog(run, pending)
+    else:
+        # Clear the right pane explicitly so Streamlit doesn't keep old content
+        # when returning from the modal dialog.
+        with right:
+            st.empty()
+
+
+# Acquisition time (legacy feel): a 6.5 s progress bar, updated in coarse steps.
+ACQUIRE_DURATION_S = 6.5
+ACQUIRE_STEPS = 13
+_ACQUIRE_TICK_S = ACQUIRE_DURATION_S / ACQUIRE_STEPS
 
+# st.fragment (Streamlit >= 1.37; experimental_fragment before) scopes the
+# progress updates to the dialog; very old builds just run them inline.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+# Screen bodies whose widgets only affect themselves run as fragments, so a
+# selector change reruns that block and not the whole desktop.
+_screen_fragment = _fragment or (lambda f: f)
+
+
+# Regime + RPM lines under the ACQUIRING caption, one markdown block per regime.
+_ACQ_HEADER_HTML = {
+    r: f"<div class='vxp-label' style='margin-top:8px;'>{REGIME_LABEL[r]}</div>"
+    f"<div class='vxp-label' style='margin-top:4px;'>RPM {BO105_DISPLAY_RPM:.0f}</div>"
+    for r in REGIMES
+}
+
+# Sunken status box of the acquisition dialog (drawn into one st.empty placeholder).
+_ACQ_BOX_OPEN = (
+    "<div class='vxp-mono' style='white-space:pre; border-top:2px solid #808080; border-left:2px solid #808080; "
+    "border-right:2px solid #ffffff; border-bottom:2px solid #ffffff; padding:10px; background:#c0c0c0;'>"
+)
+_ACQ_BOX_ACQUIRING = (
+    _ACQ_BOX_OPEN + "ACQUIRING ...\n"
+    f"RPM {BO105_DISPLAY_RPM:.0f}\n"
+    "\n"
+    "ROLL (A-B)        1P\n"
+    "ACQUIRING\n"
+    "\n"
+    "M/R LAT           1P\n"
+    "ACQUIRING\n"
+    "--------------------------------\n"
+    "M/R OBT\n"
+    "ACQUIRING\n"
+    "</div>"
+)
+_ACQ_BOX_DONE_EMPTY = _ACQ_BOX_OPEN + "ACQUISITION DONE\n</div>"
+
+
+def _acq_done_box_html(m: Measurement | None) -> str:
+    """DONE summary: amplitude @ clock position plus a compact track line."""
+    if m is None:
+        return _ACQ_BOX_DONE_EMPTY
+    blu, grn, yel, red = m.track_mm.tolist()
+    return (
+        _ACQ_BOX_OPEN + "ACQUISITION DONE\n"
+        "\n"
+        "M/R LAT           1P\n"
+        f"{float(m.balance.amp_ips):0.2f} @ {clock_label(float(m.balance.phase_deg))}\n"
+        "\n"
+        "M/R TRACK HEIGHT  mm rel. YEL\n"
+        f"BLU {blu:+5.1f}   GRN {grn:+5.1f}   YEL {yel:+5.1f}   RED {red:+5.1f}\n"
+        "</div>"
+    )
+
+
+def _acquire_elapsed() -> float:
+    """Seconds since the running acquisition started (starts one if none is running)."""
+    ss = st.session_state
+    if not ss.vxp_acq_in_progress:
+        ss.vxp_acq_in_progress = True
+        ss.vxp_acq_start_ts = time.monotonic()
+    return time.monotonic() - ss.vxp_acq_start_ts
+
+
+def _finish_acquisition(run: int, regime: str) -> None:
+    """Store one simulated measurement and close the sampling phase."""
+    ss = st.session_state
+    meas = simulate_measurement(run, regime, ss.vxp_adjustments)
+    current_run_data(run)[regime] = meas
+    mark_completed(run, regime)
+
+    ss.vxp_acq_in_progress = False
+    ss.vxp_acq_done = True
+    # Full-app rerun once, so the COLLECT list picks up the new status icon.
+    st.rerun()
+
+
+def _acquire_tick(run: int, regime: str) -> None:
+    """Fake sampling: one progress update from the wall clock, no sleeping in the script."""
+    elapsed = _acquire_elapsed()
+    st.progress(min(100, int(elapsed * 100 / ACQUIRE_DURATION_S)))
+    if elapsed >= ACQUIRE_DURATION_S:
+        _finish_acquisition(run, regime)
+
+
+if _fragment is not None:
+    # The fragment re-runs itself every tick; between ticks the session's script thread is free.
+    _acquire_fragment = _fragment(run_every=_ACQUIRE_TICK_S)(_acquire_tick)
+else:
+
+    def _acquire_fragment(run: int, regime: str) -> None:
+        prog = st.progress(0)
+        for i in range(ACQUIRE_STEPS):
+            time.sleep(_ACQUIRE_TICK_S)
+            prog.progress(int((i + 1) * 100 / ACQUIRE_STEPS))
+        _finish_acquisition(run, regime)
 
 
 def _render_acquire_dialog(run: int, regime: str) -> None:
     """Render the legacy-like ACQUIRING/DONE dialog (used inside COLLECT)."""
 
+    ss = st.session_state
     data = current_run_data(run)
-    done = completed_set(run)
-    already_taken = regime in done
+    done = completed_mask(run)
+    already_taken = bool(done & _REGIME_BIT[regime])
 
     # Title bar stays as ACQUIRING (legacy). Content will show DONE when finished.
     win_caption("ACQUIRING …", active=True)
-    st.markdown(
-        f"<div class='vxp-label' style='margin-top:8px;'>{REGIME_LABEL[regime]}</div>",
-        unsafe_allow_html=True,
-    )
-    st.markdown(f"<div class='vxp-label'>RPM {BO105_DISPLAY_RPM:.0f}</div>", unsafe_allow_html=True)
+    st.markdown(_ACQ_HEADER_HTML[regime], unsafe_allow_html=True)
 
     box = st.empty()
-    progress_ph = st.empty()
 
     # If the regime is already measured, just show the DONE summary (no re-measure).
     if already_taken:
-        st.session_state.vxp_acq_done = True
-
-    if not st.session_state.get("vxp_acq_done", False):
-        box.markdown(
-            "<div class='vxp-mono' style='white-space:pre; border-top:2px solid #808080; border-left:2px solid #808080; "
-            "border-right:2px solid #ffffff; border-bottom:2px solid #ffffff; padding:10px; background:#c0c0c0;'>"
-            "ACQUIRING ...\n"
-            f"RPM {BO105_DISPLAY_RPM:.0f}\n"
-            "\n"
-            "ROLL (A-B)        1P\n"
-            "ACQUIRING\n"
-            "\n"
-            "M/R LAT           1P\n"
-            "ACQUIRING\n"
-            "--------------------------------\n"
-            "M/R OBT\n"
-            "ACQUIRING\n"
-            "</div>",
-            unsafe_allow_html=True,
-        )
+        ss.vxp_acq_done = True
 
-        # Acquisition time: bottom progress bar (legacy feel).
-        duration_s = 6.5
-        steps = 65
-        prog = progress_ph.progress(0)
-        for i in range(steps):
-            prog.progress(int((i + 1) * 100 / steps))
-            time.sleep(duration_s / steps)
-        progress_ph.empty()
+    if not ss.get("vxp_acq_done", False):
+        box.markdown(_ACQ_BOX_ACQUIRING, unsafe_allow_html=True)
 
-        meas = simulate_measurement(run, regime, st.session_state.vxp_adjustments)
-        current_run_data(run)[regime] = meas
-        completed_set(run).add(regime)
-
-        st.session_state.vxp_acq_done = True
-        st.rerun()
+        # Non-blocking: _finish_acquisition reruns the app, which draws the DONE state.
+        _acquire_fragment(run, regime)
+        return
 
     # DONE summary
-    m = current_run_data(run).get(regime)
+    m = data.get(regime)
     status = regime_status(regime, m)
     icon = _status_icon_html(status)
 
-    if m is not None:
-        amp = float(m.balance.amp_ips)
-        ph = float(m.balance.phase_deg)
-        trk = m.track_mm
-        box.markdown(
-            "<div class='vxp-mono' style='white-space:pre; border-top:2px solid #808080; border-left:2px solid #808080; "
-            "border-right:2px solid #ffffff; border-bottom:2px solid #ffffff; padding:10px; background:#c0c0c0;'>"
-            "ACQUISITION DONE\n"
-            "\n"
-            "M/R LAT           1P\n"
-            f"{amp:0.2f} @ {clock_label(ph)}\n"
-            "\n"
-            "M/R TRACK HEIGHT  mm rel. YEL\n"
-            f"BLU {trk['BLU']:+5.1f}   GRN {trk['GRN']:+5.1f}   YEL {trk['YEL']:+5.1f}   RED {trk['RED']:+5.1f}\n"
-            "</div>",
-            unsafe_allow_html=True,
-        )
-    else:
-        box.markdown(
-            "<div class='vxp-mono' style='white-space:pre; border-top:2px solid #808080; border-left:2px solid #808080; "
-            "border-right:2px solid #ffffff; border-bottom:2px solid #ffffff; padding:10px; background:#c0c0c0;'>"
-            "ACQUISITION DONE\n"
-            "</div>",
-            unsafe_allow_html=True,
-        )
+    box.markdown(_acq_done_box_html(m), unsafe_allow_html=True)
 
     st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
 
@@ -469,131 +587,63 @@ def _render_acquire_dialog(run: int, regime: str) -> None:
             unsafe_allow_html=True,
         )
     with cols[1]:
-        if st.button("Close", use_container_width=True, key=f"acq_close_{run}_{regime}"):
-            st.session_state.vxp_pending_regime = None
-            st.session_state.vxp_acq_done = False
-            st.rerun()
+        st.button("Close", use_container_width=True, key=f"acq_close_{run}_{regime}", on_click=_close_acquire)
 
 def screen_acquire_window():
-    run = int(st.session_state.vxp_run)
-    regime = st.session_state.get("vxp_pending_regime")
+    ss = st.session_state
+    run = int(ss.vxp_run)
+    regime = ss.get("vxp_pending_regime")
     if not regime:
-        right_close_button("Close", on_click=lambda: go("collect"))
+        right_close_button("Close", target="collect")
         return
 
     left, right = st.columns([0.44, 0.56], gap="medium")
 
     data = current_run_data(run)
-    done = completed_set(run)
-    already_taken = regime in done
+    done = completed_mask(run)
+    already_taken = bool(done & _REGIME_BIT[regime])
 
     # ---------------- Left background list (static) ----------------
     with left:
         win_caption(f"RPM  {BO105_DISPLAY_RPM:.1f}", active=False)
         st.markdown(
-            f"<div class='vxp-label' style='margin-top:8px;'>Main Rotor: Run {run} &nbsp;&nbsp;&nbsp; Day Mode</div>",
+            f"<div class='vxp-label' style='margin:8px 0 10px;'>Main Rotor: Run {run} &nbsp;&nbsp;&nbsp; Day Mode</div>",
             unsafe_allow_html=True,
         )
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
 
-        for r in REGIMES:
+        for r, label, key in zip(REGIMES, REGIME_LABELS, _regime_keys("acq_bg", run)):
             cols = st.columns([0.84, 0.16])
             with cols[0]:
-                st.button(REGIME_LABEL[r], use_container_width=True, disabled=True, key=f"acq_bg_{run}_{r}")
+                st.button(label, use_container_width=True, disabled=True, key=key)
             with cols[1]:
-                icon = _status_icon_html(regime_status(r, data.get(r)))
-                st.markdown(
-                    "<div style='height:40px; display:flex; align-items:center; justify-content:center;'>"
-                    + (icon if r in done else "")
-                    + "</div>",
-                    unsafe_allow_html=True,
-                )
+                st.markdown(_regime_icon_cell(r, data, done), unsafe_allow_html=True)
 
     # ---------------- Right acquisition dialog ----------------
     with right:
         # Title bar stays as ACQUIRING (like the legacy dialog). The content will show DONE when finished.
         win_caption("ACQUIRING …", active=True)
-        st.markdown(
-            f"<div class='vxp-label' style='margin-top:8px;'>{REGIME_LABEL[regime]}</div>",
-            unsafe_allow_html=True,
-        )
-        st.markdown(f"<div class='vxp-label'>RPM {BO105_DISPLAY_RPM:.0f}</div>", unsafe_allow_html=True)
+        st.markdown(_ACQ_HEADER_HTML[regime], unsafe_allow_html=True)
 
         box = st.empty()
-        progress_ph = st.empty()
 
         # If the regime is already measured, just show the DONE summary (no re-measure).
         if already_taken:
-            st.session_state.vxp_acq_done = True
+            ss.vxp_acq_done = True
 
-        if not st.session_state.get("vxp_acq_done", False):
+        if not ss.get("vxp_acq_done", False):
             # Static ACQUIRING screen (two windows side-by-side, no fade).
-            box.markdown(
-                "<div class='vxp-mono' style='white-space:pre; border-top:2px solid #808080; border-left:2px solid #808080; "
-                "border-right:2px solid #ffffff; border-bottom:2px solid #ffffff; padding:10px; background:#c0c0c0;'>"
-                "ACQUIRING ...\n"
-                f"RPM {BO105_DISPLAY_RPM:.0f}\n"
-                "\n"
-                "ROLL (A-B)        1P\n"
-                "ACQUIRING\n"
-                "\n"
-                "M/R LAT           1P\n"
-                "ACQUIRING\n"
-                "--------------------------------\n"
-                "M/R OBT\n"
-                "ACQUIRING\n"
-                "</div>",
-                unsafe_allow_html=True,
-            )
-
-            # Acquisition time: show a bottom progress bar (legacy feel) and run slightly longer.
-            duration_s = 6.5
-            steps = 65
-            prog = progress_ph.progress(0)
-            for i in range(steps):
-                prog.progress(int((i + 1) * 100 / steps))
-                time.sleep(duration_s / steps)
-            progress_ph.empty()
+            box.markdown(_ACQ_BOX_ACQUIRING, unsafe_allow_html=True)
 
-            meas = simulate_measurement(run, regime, st.session_state.vxp_adjustments)
-            current_run_data(run)[regime] = meas
-            completed_set(run).add(regime)
-
-            st.session_state.vxp_acq_done = True
-            st.rerun()
+            # Non-blocking: _finish_acquisition reruns the app, which draws the DONE state.
+            _acquire_fragment(run, regime)
+            return
 
         # DONE summary (legacy-like)
-        m = current_run_data(run).get(regime)
+        m = data.get(regime)
         status = regime_status(regime, m)
         icon = _status_icon_html(status)
 
-        if m is not None:
-            # Legacy-style DONE summary (amplitude @ clock-position, plus a compact track snippet)
-            amp = float(m.balance.amp_ips)
-            ph = float(m.balance.phase_deg)
-            trk = m.track_mm
-
-            box.markdown(
-                "<div class='vxp-mono' style='white-space:pre; border-top:2px solid #808080; border-left:2px solid #808080; "
-                "border-right:2px solid #ffffff; border-bottom:2px solid #ffffff; padding:10px; background:#c0c0c0;'>"
-                "ACQUISITION DONE\n"
-                "\n"
-                "M/R LAT           1P\n"
-                f"{amp:0.2f} @ {clock_label(ph)}\n"
-                "\n"
-                "M/R TRACK HEIGHT  mm rel. YEL\n"
-                f"BLU {trk['BLU']:+5.1f}   GRN {trk['GRN']:+5.1f}   YEL {trk['YEL']:+5.1f}   RED {trk['RED']:+5.1f}\n"
-                "</div>",
-                unsafe_allow_html=True,
-            )
-        else:
-            box.markdown(
-                "<div class='vxp-mono' style='white-space:pre; border-top:2px solid #808080; border-left:2px solid #808080; "
-                "border-right:2px solid #ffffff; border-bottom:2px solid #ffffff; padding:10px; background:#c0c0c0;'>"
-                "ACQUISITION DONE\n"
-                "</div>",
-                unsafe_allow_html=True,
-            )
+        box.markdown(_acq_done_box_html(m), unsafe_allow_html=True)
 
         st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
 
@@ -607,94 +657,94 @@ def screen_acquire_window():
                 unsafe_allow_html=True,
             )
         with cols[1]:
-            if st.button("Close", use_container_width=True, key=f"acq_close_{run}_{regime}"):
-                st.session_state.vxp_pending_regime = None
-                st.session_state.vxp_acq_done = False
-                go("collect")
-                st.rerun()
+            st.button(
+                "Close",
+                use_container_width=True,
+                key=f"acq_close_{run}_{regime}",
+                on_click=_close_acquire,
+                args=("collect",),
+            )
 
 def screen_meas_list_window():
     win_caption("MEASUREMENTS LIST", active=True)
-    view_run = run_selector_inline(key="run_selector_generic")
+    # User request: show the report inside a NORMAL textbox (white inset area)
+    # like the early versions. We therefore strip HTML coloring and render as
+    # a disabled text_area, which is stable across Streamlit versions.
+    _report_text_body("run_selector_generic", "meas_list_box", 420)
+    right_close_button("Close", target="mr_menu")
+
+
+@_screen_fragment
+def _report_text_body(selector_key: str, box_key: str, height: int) -> None:
+    """Run selector + plain-text report box (a run change only reruns this block)."""
+    view_run = run_selector_inline(key=selector_key)
     data = current_run_data(view_run)
     if not data:
         st.write("No measurements for this run yet. Go to COLLECT.")
-        right_close_button("Close", on_click=lambda: go("mr_menu"))
         return
-    # Render inside a classic white inset box (like the legacy VXP screen).
-    # We use a <div> (not <pre>) because Streamlit + <pre> + inline <span>
-    # can sometimes break the layout and spill outside the white box.
-    st.markdown(
-        "<div class='vxp-mono' style='height:420px; overflow:auto; margin-top:8px;'>"
-        + legacy_results_text(view_run, data)
-        + "</div>",
-        unsafe_allow_html=True,
+    st.text_area(
+        "",
+        value=_cached_report_plain(view_run, regimes_key(data)),
+        height=height,
+        key=f"{box_key}_{view_run}",
+        disabled=True,
+        label_visibility="collapsed",
     )
-    right_close_button("Close", on_click=lambda: go("mr_menu"))
 
 
 def screen_meas_graph_window():
     win_caption("MEASUREMENTS GRAPH", active=True)
 
     # Compact controls (Streamlit defaults are too tall for XGA).
-    st.markdown(
-        """
-<style>
-/* Compact selectboxes only for this screen */
-div[data-testid="stVerticalBlockBorderWrapper"] div[data-testid="stSelectbox"] div[role="combobox"]{
-  min-height:24px !important;
-  height:24px !important;
-  font-size:11px !important;
-}
-div[data-testid="stVerticalBlockBorderWrapper"] div[data-testid="stSelectbox"] div[role="combobox"] > div{
-  padding-top:0 !important;
-  padding-bottom:0 !important;
-}
-</style>
-""",
-        unsafe_allow_html=True,
-    )
+    st.markdown(MEAS_GRAPH_CSS, unsafe_allow_html=True)
+    _meas_graph_body()
 
+
+def _cycle_bal_meas(available: list, sel_regime: str) -> None:
+    i = available.index(sel_regime) if sel_regime in available else 0
+    st.session_state.meas_graph_sel_regime = available[(i + 1) % len(available)]
+
+
+@_screen_fragment
+def _meas_graph_body() -> None:
+    """Controls + report + figure of MEASUREMENTS GRAPH (reruns on its own)."""
+    ss = st.session_state
     # --- Top controls row (legacy VXP-like; Maximize removed for BO105) ---
     # Legacy screen shows a compact Regime selector for the Track plots.
-    c1, c2, c3, _sp = st.columns([0.18, 0.22, 0.22, 0.38], gap="small")
+    c1, c2, c3 = st.columns([0.18, 0.22, 0.60], gap="small")
 
     with c1:
         st.markdown(
             "<div class='vxp-label' style='font-size:12px; margin:0 0 2px 0;'>Run</div>",
             unsafe_allow_html=True,
         )
-        runs = sorted(st.session_state.vxp_runs.keys())
-        cur = int(st.session_state.vxp_view_run)
-        if cur not in runs:
-            cur = runs[0]
-            st.session_state.vxp_view_run = cur
-        idx = runs.index(cur)
+        runs = ss.vxp_runs_sorted
         view_run = int(
             st.selectbox(
                 "",
                 runs,
-                index=idx,
+                index=_view_run_index(runs),
                 key="run_selector_meas_graph",
                 label_visibility="collapsed",
             )
         )
-        st.session_state.vxp_view_run = view_run
+        ss.vxp_view_run = view_run
 
     data = current_run_data(view_run)
     if not data:
         st.write("No measurements for this run yet. Go to COLLECT.")
-        right_close_button("Close", on_click=lambda: go("mr_menu"))
+        right_close_button("Close", target="mr_menu", full_rerun=True)
         return
 
-    available = [r for r in REGIMES if r in data]
+    # Regime-ordered view of the run; the regime list and the plot input both come from it.
+    compare = {r: data[r] for r in REGIMES if r in data}
+    available = list(compare)
 
     # Selected balance/track measurement (default to Ground if present).
-    st.session_state.setdefault("meas_graph_sel_regime", "GROUND")
-    sel_regime = str(st.session_state.get("meas_graph_sel_regime", "GROUND"))
+    sel_regime = str(ss.setdefault("meas_graph_sel_regime", "GROUND"))
     if sel_regime not in available:
         sel_regime = "GROUND" if "GROUND" in available else available[0]
-        st.session_state.meas_graph_sel_regime = sel_regime
+        ss.meas_graph_sel_regime = sel_regime
 
     with c2:
         st.markdown(
@@ -715,80 +765,100 @@ div[data-testid="stVerticalBlockBorderWrapper"] div[data-testid="stSelectbox"] d
             "<div class='vxp-label' style='font-size:12px; margin:0 0 2px 0;'>Regime</div>",
             unsafe_allow_html=True,
         )
-        sel_regime = st.selectbox(
-            "",
-            options=available,
-            index=available.index(sel_regime) if sel_regime in available else 0,
-            key="meas_graph_regime_sel",
-            format_func=lambda r: REGIME_LABEL.get(r, r),
-            label_visibility="collapsed",
-        )
-        st.session_state.meas_graph_sel_regime = sel_regime
+        b_l, b_r = st.columns([0.35, 0.65], gap="small")
+        with b_l:
+            # Button-based selector (legacy feel): cycles Ground -> Hover -> Horizontal.
+            # The callback runs before the (fragment) rerun, so no explicit st.rerun is needed.
+            st.button(
+                "Select Bal Meas",
+                use_container_width=True,
+                key="meas_graph_select_bal_top",
+                on_click=_cycle_bal_meas,
+                args=(available, sel_regime),
+            )
+        with b_r:
+            st.markdown(
+                f"<div class='vxp-label' style='font-size:12px; margin-top:4px;'>"
+                f"{REGIME_LABEL.get(sel_regime, sel_regime)}"
+                "</div>",
+                unsafe_allow_html=True,
+            )
 
-    compare = {r: data[r] for r in REGIMES if r in data}
+    # Import diferido: .plots arrastra matplotlib (~0.3 s) y solo lo usa esta pantalla.
+    from .plots import measurements_panel_png
 
     # --- Layout (legacy-style): list on the left, combined figure on the right. ---
-    fig = plot_measurements_panel(compare, sel_regime, blade_ref=blade_ref)
+    png = measurements_panel_png(compare, sel_regime, blade_ref=blade_ref)
     left, right = st.columns([0.54, 0.46], gap="medium")
 
     with left:
         # Render as HTML so the Adjustments block can use a stable table layout.
-        st.markdown(legacy_results_html(view_run, data), unsafe_allow_html=True)
+        st.markdown(_cached_report_html(view_run, regimes_key(data)), unsafe_allow_html=True)
 
     with right:
-        st.pyplot(fig, clear_figure=True)
-        # Buttons below the plot area (like the legacy screen).
+        st.image(png, output_format="PNG", use_container_width=True)
+        # Close button aligned bottom-right (legacy feel).
         st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
-        b1, b2 = st.columns([0.50, 0.50], gap="small")
-        with b1:
-            # Cycles through the available regimes, but keeps the UI "button-based" (no dropdown).
-            if st.button("Select Bal Meas", use_container_width=True, key="meas_graph_select_bal"):
-                if available:
-                    i = available.index(sel_regime) if sel_regime in available else 0
-                    st.session_state.meas_graph_sel_regime = available[(i + 1) % len(available)]
-                st.rerun()
-            st.markdown(
-                f"<div class='vxp-label' style='font-size:12px; margin-top:4px;'>"
-                f"{REGIME_LABEL.get(sel_regime, sel_regime)}"
-                "</div>",
-                unsafe_allow_html=True,
-            )
-        with b2:
+        cols = st.columns([0.78, 0.22])
+        with cols[1]:
+            # Inside the fragment a click only reruns the fragment: leave the screen with a full rerun.
             if st.button("Close", use_container_width=True, key="meas_graph_close_bottom"):
                 go("mr_menu")
                 st.rerun()
 
 
 
+# SETTINGS table: (adjustment field, column header, step) per editable column.
+_SETTINGS_FIELDS = (
+    ("pitch_turns", "Pitch link (turns)", 0.25),
+    ("trim_mm", "Trim tab (mm)", 0.5),
+    ("bolt_g", "Bolt weight (g)", 5.0),
+)
+_SETTINGS_COLUMN_CONFIG = {
+    "Blade": st.column_config.TextColumn("Blade"),
+    **{
+        field: st.column_config.NumberColumn(label, step=step, format="%.2f", required=True)
+        for field, label, step in _SETTINGS_FIELDS
+    },
+}
+
+
 def screen_settings_window():
     win_caption("SETTINGS", active=True)
+    _settings_editor()
+    right_close_button("Close", target="mr_menu")
+
+
+@_screen_fragment
+def _settings_editor() -> None:
     # User requested: only the Run selector (no flight/regime selector).
     run_selector_inline(key="run_selector_settings")
 
     # We keep adjustments internally per-regime, but the SETTINGS editor applies
     # the same values to all regimes so the UI matches the legacy feel.
+    adjustments = st.session_state.vxp_adjustments
     base_regime = REGIMES[0]
-    adj = st.session_state.vxp_adjustments[base_regime]
-
-    hdr = st.columns([0.20, 0.27, 0.27, 0.26])
-    hdr[0].markdown("**Blade**")
-    hdr[1].markdown("**Pitch link (turns)**")
-    hdr[2].markdown("**Trim tab (mm)**")
-    hdr[3].markdown("**Bolt weight (g)**")
-
-    for b in BLADES:
-        row = st.columns([0.20, 0.27, 0.27, 0.26])
-        row[0].markdown(b)
-        pl_v = float(row[1].number_input("", value=float(adj["pitch_turns"][b]), step=0.25, key=f"pl_all_{b}"))
-        tt_v = float(row[2].number_input("", value=float(adj["trim_mm"][b]), step=0.5, key=f"tt_all_{b}"))
-        wt_v = float(row[3].number_input("", value=float(adj["bolt_g"][b]), step=5.0, key=f"wt_all_{b}"))
-
-        for rr in REGIMES:
-            st.session_state.vxp_adjustments[rr]["pitch_turns"][b] = pl_v
-            st.session_state.vxp_adjustments[rr]["trim_mm"][b] = tt_v
-            st.session_state.vxp_adjustments[rr]["bolt_g"][b] = wt_v
+    adj = adjustments[base_regime]
+
+    # One data_editor for the whole blade table (one widget instead of 12 number_inputs).
+    # Adjustments are always floats (default_adjustments + the write-back below): no cast needed.
+    edited = st.data_editor(
+        {"Blade": list(BLADES), **{field: [adj[field][b] for b in BLADES] for field, _, _ in _SETTINGS_FIELDS}},
+        column_config=_SETTINGS_COLUMN_CONFIG,
+        disabled=["Blade"],
+        hide_index=True,
+        num_rows="fixed",
+        use_container_width=True,
+        key="adj_editor_all",
+    )
 
-    right_close_button("Close", on_click=lambda: go("mr_menu"))
+    # Only write back what the user actually changed (all regimes share the values).
+    for field, _, _ in _SETTINGS_FIELDS:
+        for b, v in zip(BLADES, edited[field]):
+            v = float(v)
+            if adj[field][b] != v:
+                for rr in REGIMES:
+                    adjustments[rr][field][b] = v
 
 
 def screen_solution_window():
@@ -797,7 +867,7 @@ def screen_solution_window():
     data = current_run_data(view_run)
     if not data:
         st.write("No measurements for this run yet. Go to COLLECT.")
-        right_close_button("Close", on_click=lambda: go("mr_menu"))
+        right_close_button("Close", target="mr_menu")
         return
 
     st.selectbox("", options=["BALANCE ONLY", "TRACK ONLY", "TRACK + BALANCE"], index=2, key="sol_type")
@@ -811,20 +881,16 @@ def screen_solution_window():
 
 def screen_solution_text_window():
     win_caption("SOLUTION", active=True)
-    view_run = run_selector_inline(key="run_selector_solution_text")
-    data = current_run_data(view_run)
-    if not data:
-        st.write("No measurements for this run yet. Go to COLLECT.")
-        right_close_button("Close", on_click=lambda: go("mr_menu"))
-        return
-    # Use a <pre> block so the legacy spacing for Solution/Prediction stays aligned.
-    st.markdown(
-        f"<pre class='vxp-mono' style='height:380px; overflow:auto; margin-top:8px;'>"
-        f"{legacy_results_text(view_run, data)}"
-        "</pre>",
-        unsafe_allow_html=True,
-    )
-    right_close_button("Close", on_click=lambda: go("mr_menu"))
+    # User request: SOLUTION should be a normal report textbox (no broken
+    # inline coloring). We render plain text in a disabled text_area.
+    _report_text_body("run_selector_solution_text", "solution_box", 380)
+    right_close_button("Close", target="mr_menu")
+
+
+def _start_next_run(nxt: int, target: str) -> None:
+    st.session_state.vxp_run = nxt
+    ensure_run(nxt)
+    go(target)
 
 
 def screen_next_run_window():
@@ -833,109 +899,102 @@ def screen_next_run_window():
 
     win_caption("NEXT RUN", active=True)
     st.markdown(
-        f"<div class='vxp-label' style='margin-top:8px;'>Current run: {run}. This simulator supports up to 3 runs.</div>",
+        f"<div class='vxp-label' style='margin:8px 0 14px;'>Current run: {run}. This simulator supports up to 3 runs.</div>",
         unsafe_allow_html=True,
     )
 
-    st.markdown("<div style='height:14px;'></div>", unsafe_allow_html=True)
     pad_l, mid, pad_r = st.columns([0.08, 0.84, 0.08])
 
     with mid:
         # Match the legacy three-action layout
-        if st.button(
+        st.button(
             f"UPDATE SETTINGS - START NEXT RUN {nxt}",
             use_container_width=True,
             disabled=(run >= 3),
             key=f"nr_update_{run}",
-        ):
-            st.session_state.vxp_run = nxt
-            st.session_state.vxp_runs.setdefault(nxt, {})
-            st.session_state.vxp_completed_by_run.setdefault(nxt, set())
-            go("settings")
-            st.rerun()
+            on_click=_start_next_run,
+            args=(nxt, "settings"),
+        )
 
         st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
 
-        if st.button(
+        st.button(
             f"NO CHANGES MADE - START NEXT RUN {nxt}",
             use_container_width=True,
             disabled=(run >= 3),
             key=f"nr_nochg_{run}",
-        ):
-            st.session_state.vxp_run = nxt
-            st.session_state.vxp_runs.setdefault(nxt, {})
-            st.session_state.vxp_completed_by_run.setdefault(nxt, set())
-            go("mr_menu")
-            st.rerun()
+            on_click=_start_next_run,
+            args=(nxt, "mr_menu"),
+        )
 
         st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
 
-        if st.button(
+        st.button(
             f"CANCEL - STAY ON RUN {run}",
             use_container_width=True,
             key=f"nr_cancel_{run}",
-        ):
-            go("mr_menu")
-            st.rerun()
+            on_click=go,
+            args=("mr_menu",),
+        )
 
     # Place Close at bottom-right like the legacy dialog.
     st.markdown("<div style='height:220px;'></div>", unsafe_allow_html=True)
     cols = st.columns([0.78, 0.22])
     with cols[1]:
-        if st.button("Close", use_container_width=True, key=f"nr_close_{run}"):
-            go("mr_menu")
-            st.rerun()
+        st.button("Close", use_container_width=True, key=f"nr_close_{run}", on_click=go, args=("mr_menu",))
+
+# Left-hand labels of AIRCRAFT INFO in one block (divs, so no <p> bottom margins
+# pile up); the 14px steps include the gap the separate markdown calls used to add.
+_AIRCRAFT_LABELS_HTML = (
+    "<div style='margin-top:8px;'>WEIGHT:</div>"
+    "<div style='margin-top:14px;'>C.G. :</div>"
+    "<div style='margin-top:14px;'>HOURS:</div>"
+    "<div style='margin-top:14px;'>INITIALS:</div>"
+)
+
 
 def screen_aircraft_info_window():
-    win_caption("AIRCRAFT INFO", active=True)
-    st.markdown("<div style='height:12px;'></div>", unsafe_allow_html=True)
+    win_caption("AIRCRAFT INFO", active=True, space=12)
 
-    info = st.session_state["vxp_aircraft"]
+    info: AircraftInfo = st.session_state.vxp_aircraft
 
     # Layout like the legacy dialog: labels at left, inputs centered, empty area at right.
     lab, inp, _pad = st.columns([0.30, 0.36, 0.34], gap="large")
     with lab:
-        st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
-        st.markdown("WEIGHT:")
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-        st.markdown("C.G. :")
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-        st.markdown("HOURS:")
-        st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-        st.markdown("INITIALS:")
+        st.markdown(_AIRCRAFT_LABELS_HTML, unsafe_allow_html=True)
 
     with inp:
-        info["weight"] = float(
+        info.weight = float(
             st.number_input(
                 "",
-                value=float(info.get("weight", 0.0)),
+                value=float(info.weight),
                 step=1.0,
                 key="air_weight",
                 label_visibility="collapsed",
             )
         )
-        info["cg"] = float(
+        info.cg = float(
             st.number_input(
                 "",
-                value=float(info.get("cg", 0.0)),
+                value=float(info.cg),
                 step=0.1,
                 key="air_cg",
                 label_visibility="collapsed",
             )
         )
-        info["hours"] = float(
+        info.hours = float(
             st.number_input(
                 "",
-                value=float(info.get("hours", 0.0)),
+                value=float(info.hours),
                 step=1.0,
                 key="air_hours",
                 label_visibility="collapsed",
             )
         )
-        info["initials"] = str(
+        info.initials = str(
             st.text_input(
                 "",
-                value=str(info.get("initials", "")),
+                value=str(info.initials),
                 key="air_initials",
                 label_visibility="collapsed",
             )
@@ -944,17 +1003,25 @@ def screen_aircraft_info_window():
     st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
     pad_l, mid, pad_r = st.columns([0.08, 0.84, 0.08])
     with mid:
-        if st.button("Note Codes", use_container_width=True, key="air_note_codes"):
-            go("note_codes")
-            st.rerun()
+        st.button("Note Codes", use_container_width=True, key="air_note_codes", on_click=go, args=("note_codes",))
 
     st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
-    right_close_button("Close", on_click=lambda: go("home"))
+    right_close_button("Close", target="home")
+
+
+# Check column of NOTE CODES: the two possible cells, built once.
+_NOTE_CHECK_CELL = {
+    checked: f"<div style='font-size:22px; font-weight:900; padding-top:10px;'>{'✓' if checked else ''}</div>"
+    for checked in (False, True)
+}
+
+
+def _toggle_note_code(code: int) -> None:
+    st.session_state.vxp_note_codes ^= 1 << code
 
 
 def screen_note_codes_window():
-    win_caption("NOTE CODES", active=True)
-    st.markdown("<div style='height:10px;'></div>", unsafe_allow_html=True)
+    win_caption("NOTE CODES", active=True, space=10)
 
     # Minimal set (training / placeholder). You can extend this list later.
     codes = [
@@ -967,7 +1034,7 @@ def screen_note_codes_window():
         (6, "Component Change"),
     ]
 
-    selected = st.session_state["vxp_note_codes"]
+    selected = int(st.session_state.vxp_note_codes)
 
     # Centered list with a check column, like other VXP screens.
     pad_l, mid, pad_r = st.columns([0.10, 0.80, 0.10])
@@ -975,24 +1042,45 @@ def screen_note_codes_window():
         for code, name in codes:
             cols = st.columns([0.84, 0.16], gap="small")
             with cols[0]:
-                if st.button(f"{code:02d}  {name}", use_container_width=True, key=f"nc_btn_{code}"):
-                    if code in selected:
-                        selected.remove(code)
-                    else:
-                        selected.add(code)
-                    st.rerun()
-            with cols[1]:
-                st.markdown(
-                    f"<div style='font-size:22px; font-weight:900; padding-top:10px;'>"
-                    f"{'✓' if code in selected else ''}"
-                    "</div>",
-                    unsafe_allow_html=True,
+                st.button(
+                    f"{code:02d}  {name}",
+                    use_container_width=True,
+                    key=f"nc_btn_{code}",
+                    on_click=_toggle_note_code,
+                    args=(code,),
                 )
+            with cols[1]:
+                st.markdown(_NOTE_CHECK_CELL[bool(selected >> code & 1)], unsafe_allow_html=True)
 
-    right_close_button("Close", on_click=lambda: go("aircraft_info"))
+    right_close_button("Close", target="aircraft_info")
 
 
 def screen_not_impl_window():
     win_caption("VXP", active=True)
     st.write("Solo se implementa **Main Rotor – Tracking & Balance (Option B)** para el BO105.")
-    right_close_button("Close", on_click=lambda: go("home"))
+    right_close_button("Close", target="home")
+
+
+def _redirect_acquire_window():
+    # Backward compatibility: older builds navigated to an explicit
+    # ACQUIRE screen. We now render acquisition as a modal inside COLLECT
+    # to avoid duplicate button panes. Draw COLLECT in this same run instead
+    # of paying a second script execution for the redirect.
+    go("collect")
+    screen_collect_window()
+
+
+# Screen id -> window renderer (unknown ids fall back to screen_not_impl_window).
+_SCREEN_DISPATCH: Dict[str, Callable[[], None]] = {
+    "mr_menu": screen_mr_menu_window,
+    "collect": screen_collect_window,
+    "acquire": _redirect_acquire_window,
+    "meas_list": screen_meas_list_window,
+    "meas_graph": screen_meas_graph_window,
+    "settings": screen_settings_window,
+    "solution": screen_solution_window,
+    "solution_text": screen_solution_text_window,
+    "next_run_prompt": screen_next_run_window,
+    "aircraft_info": screen_aircraft_info_window,
+    "note_codes": screen_note_codes_window,
+}